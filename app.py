@@ -10,6 +10,7 @@ load_dotenv()
 
 from src.api.v1 import router as rapidapi_router
 from src.api.direct import router as direct_router
+from src.core.analyzer_fast import shutdown_process_pool
 from src.utils.logging_config import logger
 
 # Create FastAPI app
@@ -53,6 +54,13 @@ async def root():
     }
 
 
+# Stop analysis worker processes (FAST_ANALYZER_PROCESSES) on exit
+@app.on_event("shutdown")
+async def shutdown():
+    """Shutdown hook."""
+    shutdown_process_pool()
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
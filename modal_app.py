@@ -128,6 +128,7 @@ def fastapi_app():
     # Local imports
     from src.api.v1 import router as rapidapi_router
     from src.api.direct import router as direct_router
+    from src.core.analyzer_fast import shutdown_process_pool
     from src.utils.logging_config import logger
 
     app = FastAPI(
@@ -161,6 +162,10 @@ def fastapi_app():
             "health": "/api/v1/health",
         }
 
+    @app.on_event("shutdown")
+    async def shutdown():
+        shutdown_process_pool()
+
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
         logger.error("Unhandled exception", exc_info=True)
@@ -27,15 +27,17 @@ if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 from src.core.engine_runner import run_engine
-from src.core.audio_processing import (
+from src.audio.processing import (
     load_audio,
     transcribe_verbatim_fillers,
     extract_words_dataframe,
     extract_segments_dataframe,
+    CORE_FILLERS,
+)
+from src.audio.filler_detection import (
     mark_filler_words,
     get_content_words,
     mark_filler_segments,
-    CORE_FILLERS,
 )
 from src.core.fluency_metrics import analyze_fluency
 from src.core.analyze_band import build_analysis
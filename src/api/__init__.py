@@ -15,6 +15,7 @@ from src.services import AnalysisService
 from src.core.job_queue import JobQueue
 from src.utils.logging_config import logger
 from src.utils.exceptions import AudioNotFoundError, AudioFormatError, AudioDurationError
+from src.api.protections import validate_file_suffix
 
 router = APIRouter()
 job_queue = JobQueue()  # Singleton job tracker
@@ -52,6 +53,7 @@ async def analyze_audio_upload(
         status: Always "queued"
         message: Instructions for polling
     """
+    suffix = validate_file_suffix(file)
     job_id = str(uuid.uuid4())
     
     try:
@@ -61,7 +63,7 @@ async def analyze_audio_upload(
         raise HTTPException(status_code=500, detail="Internal error")
     
     # Save uploaded file to temp location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
         tmp.write(await file.read())
         tmp_path = tmp.name
     
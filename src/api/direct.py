@@ -14,6 +14,7 @@ from src.core.analyzer_fast import analyze_speech_fast
 from src.services.response_builder import build_response
 from src.utils.logging_config import logger
 from src.utils.exceptions import AudioNotFoundError, AudioFormatError, AudioDurationError
+from src.api.protections import validate_file_suffix
 
 router = APIRouter()
 
@@ -75,6 +76,7 @@ async def analyze_audio_direct(
         status: Always "queued"
         message: Instructions for polling
     """
+    suffix = validate_file_suffix(file)
     job_id = str(uuid.uuid4())
     
     try:
@@ -84,7 +86,7 @@ async def analyze_audio_direct(
         raise HTTPException(status_code=500, detail="Internal error")
     
     # Save uploaded file to temp location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
         tmp.write(await file.read())
         tmp_path = tmp.name
     
@@ -139,6 +141,7 @@ async def analyze_audio_direct_fast(
         mode: "fast" (indicates fast variant)
         message: Instructions for polling
     """
+    suffix = validate_file_suffix(file)
     job_id = str(uuid.uuid4())
     
     try:
@@ -148,7 +151,7 @@ async def analyze_audio_direct_fast(
         raise HTTPException(status_code=500, detail="Internal error")
     
     # Save uploaded file to temp location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
         tmp.write(await file.read())
         tmp_path = tmp.name
     
@@ -1,4 +1,5 @@
 """Server-side protections against abuse and resource exhaustion."""
+import os
 import time
 from collections import defaultdict
 from fastapi import HTTPException, UploadFile, Request
@@ -8,6 +9,7 @@ from src.utils.logging_config import logger
 MAX_FILE_SIZE_MB = 15
 MAX_AUDIO_DURATION_MINUTES = 5
 RATE_LIMIT_REQUESTS_PER_HOUR = 100
+ALLOWED_AUDIO_SUFFIXES = {".wav", ".mp3", ".m4a", ".flac", ".ogg", ".webm"}
 
 # In-memory rate limiter: {user_id: [timestamps]}
 rate_limit_tracker = defaultdict(list)
@@ -35,6 +37,34 @@ async def validate_file_size(file: UploadFile, max_mb: int = MAX_FILE_SIZE_MB) -
         )
 
 
+def validate_file_suffix(file: UploadFile) -> str:
+    """
+    Validate and sanitize the uploaded file's extension.
+    
+    The filename is user-controlled, so only the extension is kept and it
+    must be one of ALLOWED_AUDIO_SUFFIXES. Runs before the body is read.
+    
+    Args:
+        file: Uploaded file
+        
+    Returns:
+        Sanitized, lower-cased suffix (e.g. ".wav") safe for temp file names
+        
+    Raises:
+        HTTPException 415 if the extension is not a supported audio format
+    """
+    suffix = os.path.splitext(file.filename or "")[1][:8].lower()
+    
+    if suffix not in ALLOWED_AUDIO_SUFFIXES:
+        logger.warning(f"[Protection] Unsupported file type: {file.filename!r}")
+        raise HTTPException(
+            status_code=415,
+            detail=f"Unsupported audio format. Allowed: {', '.join(sorted(ALLOWED_AUDIO_SUFFIXES))}"
+        )
+    
+    return suffix
+
+
 async def validate_audio_duration(audio_path: str, max_minutes: int = MAX_AUDIO_DURATION_MINUTES) -> None:
     """
     Validate audio file duration before processing.
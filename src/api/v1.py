@@ -16,6 +16,7 @@ from src.utils.logging_config import logger
 from src.utils.exceptions import AudioNotFoundError, AudioFormatError, AudioDurationError
 from src.api.protections import (
     validate_file_size,
+    validate_file_suffix,
     validate_audio_duration,
     check_rate_limit,
     enforce_rapidapi_only
@@ -52,6 +53,7 @@ async def analyze_audio_rapidapi(
     
     PROTECTIONS:
     - File size limit: 15MB max
+    - File type: common audio extensions only (415 otherwise)
     - Audio duration: 30 minutes max
     - Rate limiting: 100 requests/hour per user
     - RapidAPI-only: Must come through RapidAPI Gateway
@@ -73,8 +75,9 @@ async def analyze_audio_rapidapi(
     # PROTECTION 2: Rate limit per user
     check_rate_limit(auth.owner_id)
     
-    # PROTECTION 3: Validate file size
+    # PROTECTION 3: Validate file size and type
     await validate_file_size(file)
+    suffix = validate_file_suffix(file)
     
     job_id = str(uuid.uuid4())
     
@@ -85,7 +88,7 @@ async def analyze_audio_rapidapi(
         raise HTTPException(status_code=500, detail="Internal error")
     
     # Save uploaded file to temp location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
         tmp.write(await file.read())
         tmp_path = tmp.name
     
@@ -173,6 +176,7 @@ async def analyze_audio_rapidapi_fast(
     
     PROTECTIONS:
     - File size limit: 15MB max
+    - File type: common audio extensions only (415 otherwise)
     - Audio duration: 30 minutes max
     - Rate limiting: 100 requests/hour per user (same as /analyze)
     - RapidAPI-only: Must come through RapidAPI Gateway
@@ -195,8 +199,9 @@ async def analyze_audio_rapidapi_fast(
     # PROTECTION 2: Rate limit per user (shared with /analyze)
     check_rate_limit(auth.owner_id)
     
-    # PROTECTION 3: Validate file size
+    # PROTECTION 3: Validate file size and type
     await validate_file_size(file)
+    suffix = validate_file_suffix(file)
     
     job_id = str(uuid.uuid4())
     
@@ -207,7 +212,7 @@ async def analyze_audio_rapidapi_fast(
         raise HTTPException(status_code=500, detail="Internal error")
     
     # Save uploaded file to temp location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
         tmp.write(await file.read())
         tmp_path = tmp.name
     
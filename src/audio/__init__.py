@@ -1,7 +1,9 @@
 """Audio processing and transcription modules."""
 from .processing import (
     load_audio,
+    transcribe,
     transcribe_with_whisper,
+    transcribe_many,
     transcribe_verbatim_fillers,
     align_words_whisperx,
     extract_words_dataframe,
@@ -11,6 +13,7 @@ from .filler_detection import (
     is_filler_word,
     mark_filler_words,
     get_content_words,
+    split_content_words,
     mark_filler_segments,
     detect_fillers_wav2vec,
     detect_fillers_whisper,
@@ -20,7 +23,9 @@ from .filler_detection import (
 
 __all__ = [
     "load_audio",
+    "transcribe",
     "transcribe_with_whisper",
+    "transcribe_many",
     "transcribe_verbatim_fillers",
     "align_words_whisperx",
     "extract_words_dataframe",
@@ -28,6 +33,7 @@ __all__ = [
     "is_filler_word",
     "mark_filler_words",
     "get_content_words",
+    "split_content_words",
     "mark_filler_segments",
     "detect_fillers_wav2vec",
     "detect_fillers_whisper",
@@ -1,11 +1,15 @@
 # src/audio/filler_detection.py
 """Filler and disfluency detection using multiple methods."""
+import contextlib
 import re
 import os
-import soundfile as sf
+import string
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from typing import Tuple, Set
+from typing import Optional, Tuple, Set, Union
 
+from src.audio.processing import read_mono_float32, resample_to_16k, _resolve_device
 from src.utils.config import (
     CORE_FILLERS,
     FILLER_MAP,
@@ -18,17 +22,56 @@ from src.utils.config import (
 )
 
 
+# Phoneme label patterns (compiled once, shared by scalar and vectorized paths)
+_DEDUP = re.compile(r"(.)\1+")
+_EDGE_PUNCT = re.compile(r"^[^\w]+|[^\w]+$")
+# ASCII punctuation and whitespace; '_' is a word character so it stays
+_PUNCT_CHARS = string.punctuation.replace("_", "") + string.whitespace
+
+# Word-level filler variants checked by is_filler_word, fused into one
+# alternation so each word is scanned once: uhhh/ehhh/ahhh, ummm, mmmm/nnnn,
+# um/umm/uhhm, uh/uhh, er/err/erm
+_FILLER_UNION = re.compile(r"(?:[uea]h{2,}|[ume]{2,}|[mn]{2,}|u+h*m+|u+h+|e+r+m*)")
+
+# Column-wise fullmatch takes plain pattern strings (_FILLER_UNION.pattern for
+# the fused variants): Arrow-backed columns reject compiled re.Pattern objects
+# there and anchor the string as ^...$ without a group, so alternations must
+# be wrapped in (?:...).
+# _EDGE_PUNCT and _DEDUP stay compiled; their str.replace passes run per element
+# in Python's re (Unicode \w, and a backreference RE2 cannot express).
+_FILLER_SHAPE_REGEX = r"(?:[AEIOUH]+|M+|N+)"  # vowel hesitations | nasal hums
+
+# Label columns use Arrow-backed strings when pyarrow is available, so
+# .str.upper()/.str.lower()/isin run in Arrow kernels instead of per-object
+try:
+    import pyarrow  # noqa: F401
+    _LABEL_DTYPE = "string[pyarrow]"
+except ImportError:
+    _LABEL_DTYPE = object
+
+# numba comes in with openai-whisper/librosa; without it the kernels below
+# run as plain Python with identical results
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
 # ==============================
 # WORD-LEVEL FILLER DETECTION
 # ==============================
 
+@lru_cache(maxsize=4096)
 def normalize_word(word: str) -> str:
     """
     Normalize a word for filler detection.
     
     - Strips punctuation
     - Converts to lowercase
-    - Removes extra whitespace
+    - Strips surrounding whitespace
     
     Args:
         word: Raw word string from transcription
@@ -36,11 +79,23 @@ def normalize_word(word: str) -> str:
     Returns:
         Normalized word string
     """
-    word = re.sub(r'^[^\w]+|[^\w]+$', '', word.lower().strip())
-    word = re.sub(r'\s+', ' ', word)
+    word = word.lower().strip(_PUNCT_CHARS)
+    # Non-ASCII edge punctuation (…, —, ¿) is rare; only then run the regex
+    if word and not (_is_word_char(word[0]) and _is_word_char(word[-1])):
+        word = _EDGE_PUNCT.sub('', word)
     return word
 
 
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+@lru_cache(maxsize=4096)
+def _is_filler_variant(normalized: str) -> bool:
+    """Cached _FILLER_UNION check; speech repeats the same tokens a lot."""
+    return _FILLER_UNION.fullmatch(normalized) is not None
+
+
 def is_filler_word(
     word: str,
     filler_set: Set[str] = CORE_FILLERS,
@@ -66,29 +121,42 @@ def is_filler_word(
     if normalized in filler_set:
         return True
     
-    # Pattern matching for variations
+    # Pattern matching for variations: repeated vowels (uhhhh, ummmm),
+    # elongated nasals (mmmm, nnnn) and um/uh/er variants with extra letters
     if include_pattern_match:
-        # Repeated vowels: uhhhhh, ummmm, ahhhhh
-        if re.fullmatch(r'[uea]h{2,}', normalized):
-            return True
-        if re.fullmatch(r'[ume]{2,}', normalized):
-            return True
-        
-        # Elongated nasals: mmmmm, nnnn
-        if re.fullmatch(r'[mn]{2,}', normalized):
-            return True
-        
-        # Um/uh variants with extra letters
-        if re.fullmatch(r'u+h*m+', normalized):
-            return True
-        if re.fullmatch(r'u+h+', normalized):
-            return True
-        if re.fullmatch(r'e+r+m*', normalized):
+        if _is_filler_variant(normalized):
             return True
     
     return False
 
 
+def filler_mask(words: pd.Series, filler_set: Set[str] = CORE_FILLERS) -> np.ndarray:
+    """
+    Vectorized is_filler_word over a column of words.
+    
+    Normalizes the whole column with str ops, then does one set-membership
+    pass and one fused regex pass.
+    
+    Args:
+        words: Column of raw words
+        filler_set: Set of filler words
+        
+    Returns:
+        Boolean array, True where the word is a filler
+    """
+    if words.empty:
+        # Empty columns may not be string-typed, so skip the .str accessor
+        return np.zeros(0, dtype=bool)
+    
+    normalized = (
+        words.str.lower().str.strip()
+        .str.replace(_EDGE_PUNCT, '', regex=True)
+    )
+    is_direct = normalized.isin(filler_set).to_numpy(dtype=bool)
+    is_variant = normalized.str.fullmatch(_FILLER_UNION.pattern).fillna(False).to_numpy(dtype=bool)
+    return is_direct | is_variant
+
+
 def mark_filler_words(
     df_words: pd.DataFrame,
     filler_set: Set[str] = CORE_FILLERS,
@@ -103,31 +171,47 @@ def mark_filler_words(
         word_column: Name of column containing words
         
     Returns:
-        DataFrame with added 'is_filler' column
+        DataFrame with added 'is_filler' column. Existing columns are
+        shared with the input (shallow copy), so don't modify them in place.
     """
-    df = df_words.copy()
+    # Shallow copy: adding a column must not touch the caller's frame, but
+    # there is no need to clone every existing column to do it
+    df = df_words.copy(deep=False)
     
-    df['is_filler'] = df[word_column].apply(
-        lambda w: is_filler_word(w, filler_set)
-    )
+    df['is_filler'] = filler_mask(df[word_column], filler_set)
     
     return df
 
 
-def get_content_words(df_words: pd.DataFrame) -> pd.DataFrame:
+def split_content_words(df_words: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
     """
-    Extract only content words (non-fillers).
+    Extract content words (non-fillers) along with the mask that selected them.
     
     Args:
         df_words: DataFrame with 'is_filler' column
         
     Returns:
-        Filtered DataFrame with only content words
+        Tuple of (filtered DataFrame with only content words, boolean
+        ndarray marking the content rows of df_words by position)
     """
     if 'is_filler' not in df_words.columns:
         raise ValueError("DataFrame must have 'is_filler' column. Run mark_filler_words() first.")
     
-    return df_words[~df_words['is_filler']].copy().reset_index(drop=True)
+    content_mask = ~df_words['is_filler'].to_numpy(dtype=bool)
+    return df_words.iloc[np.flatnonzero(content_mask)].reset_index(drop=True), content_mask
+
+
+def get_content_words(df_words: pd.DataFrame) -> pd.DataFrame:
+    """
+    Extract only content words (non-fillers).
+    
+    Args:
+        df_words: DataFrame with 'is_filler' column
+        
+    Returns:
+        Filtered DataFrame with only content words
+    """
+    return split_content_words(df_words)[0]
 
 
 def segment_contains_filler(segment_text: str, filler_set: Set[str] = CORE_FILLERS) -> bool:
@@ -142,6 +226,11 @@ def segment_contains_filler(segment_text: str, filler_set: Set[str] = CORE_FILLE
         True if segment contains fillers
     """
     words = segment_text.lower().split()
+    
+    # Bare tokens like "um" resolve with one C-level set check; only
+    # punctuated or elongated variants need the per-token normalization
+    if not filler_set.isdisjoint(words):
+        return True
     return any(is_filler_word(w, filler_set) for w in words)
 
 
@@ -159,13 +248,26 @@ def mark_filler_segments(
         text_column: Name of column containing segment text
         
     Returns:
-        DataFrame with added 'contains_filler' column
+        DataFrame with added 'contains_filler' column. Existing columns are
+        shared with the input (shallow copy), so don't modify them in place.
     """
-    df = df_segments.copy()
-    
-    df['contains_filler'] = df[text_column].apply(
-        lambda text: segment_contains_filler(text, filler_set)
-    )
+    # Shallow copy: adding a column must not touch the caller's frame, but
+    # there is no need to clone every existing column to do it
+    df = df_segments.copy(deep=False)
+    
+    # Split every segment into tokens once and classify them all in one
+    # vectorized pass, then OR the token flags back onto their segments
+    contains = np.zeros(len(df), dtype=bool)
+    if len(df):
+        tokens = (
+            pd.Series(df[text_column].to_numpy(dtype=object))
+            .str.lower().str.split()
+            .explode()
+            .dropna()
+        )
+        is_filler = filler_mask(tokens, filler_set)
+        contains[tokens.index.to_numpy()[is_filler]] = True
+    df['contains_filler'] = contains
     
     return df
 
@@ -174,25 +276,49 @@ def mark_filler_segments(
 # WAV2VEC2 PHONEME DETECTION
 # ==============================
 
-def detect_phonemes_wav2vec(audio_path: str) -> pd.DataFrame:
+# Recordings longer than this are split into overlapping windows for Wav2Vec2
+PARALLEL_MIN_SEC = 60.0
+
+
+@lru_cache(maxsize=1)
+def _get_wav2vec_models(cache_dir: Optional[str], device: str = "cpu"):
     """
-    Detect phoneme-level events using Wav2Vec2.
+    Load the Wav2Vec2 processor and model once, on device, and reuse them.
     
-    Args:
-        audio_path: Path to audio file
-        
-    Returns:
-        DataFrame with phoneme events (label, start, end, duration)
+    Recovers from a corrupted download cache by clearing it and retrying.
     """
     from transformers.models.wav2vec2 import Wav2Vec2Processor, Wav2Vec2ForCTC
     import shutil
     
-    # Use HF_HOME from environment (set by Modal) for model caching
-    cache_dir = os.getenv("HF_HOME", None)
-    
-    def load_wav2vec_models():
-        """Load models with automatic cache recovery on corruption."""
-        try:
+    try:
+        processor = Wav2Vec2Processor.from_pretrained(
+            "facebook/wav2vec2-large-960h",
+            cache_dir=cache_dir
+        )
+        wav2vec = Wav2Vec2ForCTC.from_pretrained(
+            "facebook/wav2vec2-large-960h",
+            cache_dir=cache_dir
+        )
+        wav2vec.to(device).eval()
+        return processor, wav2vec
+    except (OSError, UnicodeDecodeError) as e:
+        # Cache corrupted - try to clear it and retry
+        if "Invalid argument" in str(e) or "UnicodeDecodeError" in str(type(e).__name__):
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.warning("Wav2Vec2 cache corrupted, rebuilding...")
+            
+            # Clear the corrupted cache
+            if cache_dir:
+                wav2vec_cache = os.path.join(cache_dir, "models--facebook--wav2vec2-large-960h")
+                if os.path.exists(wav2vec_cache):
+                    try:
+                        shutil.rmtree(wav2vec_cache)
+                        logger.info(f"Cleared corrupted cache: {wav2vec_cache}")
+                    except Exception as cleanup_err:
+                        logger.error(f"Failed to clear cache: {cleanup_err}")
+            
+            # Retry with fresh download
             processor = Wav2Vec2Processor.from_pretrained(
                 "facebook/wav2vec2-large-960h",
                 cache_dir=cache_dir
@@ -201,115 +327,252 @@ def detect_phonemes_wav2vec(audio_path: str) -> pd.DataFrame:
                 "facebook/wav2vec2-large-960h",
                 cache_dir=cache_dir
             )
-            wav2vec.eval()
+            wav2vec.to(device).eval()
+            logger.info("Wav2Vec2 models loaded successfully after cache rebuild")
             return processor, wav2vec
-        except (OSError, UnicodeDecodeError) as e:
-            # Cache corrupted - try to clear it and retry
-            if "Invalid argument" in str(e) or "UnicodeDecodeError" in str(type(e).__name__):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning("Wav2Vec2 cache corrupted, rebuilding...")
-                
-                # Clear the corrupted cache
-                if cache_dir:
-                    wav2vec_cache = os.path.join(cache_dir, "models--facebook--wav2vec2-large-960h")
-                    if os.path.exists(wav2vec_cache):
-                        try:
-                            shutil.rmtree(wav2vec_cache)
-                            logger.info(f"Cleared corrupted cache: {wav2vec_cache}")
-                        except Exception as cleanup_err:
-                            logger.error(f"Failed to clear cache: {cleanup_err}")
-                
-                # Retry with fresh download
-                processor = Wav2Vec2Processor.from_pretrained(
-                    "facebook/wav2vec2-large-960h",
-                    cache_dir=cache_dir
-                )
-                wav2vec = Wav2Vec2ForCTC.from_pretrained(
-                    "facebook/wav2vec2-large-960h",
-                    cache_dir=cache_dir
-                )
-                wav2vec.eval()
-                logger.info("Wav2Vec2 models loaded successfully after cache rebuild")
-                return processor, wav2vec
-            else:
-                raise
-    
-    processor, wav2vec = load_wav2vec_models()
-    
-    # Load audio
-    waveform, sr = sf.read(audio_path, dtype="float32")
-    
-    # Convert stereo to mono
-    if waveform.ndim == 2:
-        waveform = waveform.mean(axis=1)
+        else:
+            raise
+
+
+def detect_phonemes_wav2vec(
+    audio_or_path: Union[str, np.ndarray],
+    device: str = "cpu"
+) -> pd.DataFrame:
+    """
+    Detect phoneme-level events using Wav2Vec2.
+    
+    Args:
+        audio_or_path: Path to audio file, or an already-decoded mono
+            16kHz float32 waveform (e.g. from load_audio) to skip reading
+            and resampling the file again
+        device: Device to run on ('cpu' or 'cuda'); CUDA runs in fp16 autocast
+        
+    Returns:
+        DataFrame with phoneme events (label, start, end, duration)
+    """
+    # Use HF_HOME from environment (set by Modal) for model caching
+    processor, wav2vec = _get_wav2vec_models(os.getenv("HF_HOME", None), _resolve_device(device))
+    
+    if isinstance(audio_or_path, np.ndarray):
+        waveform, sr = audio_or_path, 16000
+    else:
+        # Load audio block-wise, downmixing to mono in place
+        waveform, sr = read_mono_float32(audio_or_path)
+        
+        # Resample to 16kHz if needed
+        if sr != 16000:
+            waveform = resample_to_16k(waveform, sr)
+            sr = 16000
     
     import torch
-    import torchaudio
     waveform = torch.from_numpy(waveform)
+    if waveform.shape[-1] / sr > PARALLEL_MIN_SEC:
+        events = _wav2vec_events_parallel(processor, wav2vec, waveform)
+    else:
+        events = _wav2vec_events(processor, wav2vec, waveform)
+    
+    df = pd.DataFrame(events)
+    if df.empty:
+        return df
+    
+    df["label"] = df["label"].astype(_LABEL_DTYPE)
+    df["duration"] = df["end"] - df["start"]
+    df["labels"] = df["label"]
+    
+    # Merge adjacent same-label events
+    df = merge_adjacent_events(df)
+    
+    return df
+
+
+@lru_cache(maxsize=None)
+def _wav2vec_stream(device_index: Optional[int], slot: int = 0):
+    """Side CUDA stream for Wav2Vec2 work, created once per (device, slot)."""
+    import torch
+    return torch.cuda.Stream(device=device_index)
+
+
+def _wav2vec_events(
+    processor,
+    wav2vec,
+    waveform,
+    offset: float = 0.0,
+    stream_slot: int = 0
+) -> list:
+    """
+    Run Wav2Vec2 on one 16kHz waveform and collapse CTC tokens into events.
     
-    # Resample to 16kHz if needed
-    if sr != 16000:
-        waveform = torchaudio.functional.resample(waveform, sr, 16000)
-        sr = 16000
+    Args:
+        processor: Wav2Vec2Processor
+        wav2vec: Wav2Vec2ForCTC model
+        waveform: 1-D 16kHz waveform tensor
+        offset: Seconds added to every event time (chunk start)
+        stream_slot: Which side CUDA stream to run on; concurrent callers
+            pass distinct slots so their kernels can overlap
+        
+    Returns:
+        List of {"label", "start", "end"} dicts
+    """
+    import torch
     
     # Prepare input
     inputs = processor(
-        waveform.squeeze(),
+        waveform,
         sampling_rate=16000,
         return_tensors="pt",
     )
     
-    # Ensure model and inputs are on the same device
     device = next(wav2vec.parameters()).device
-    inputs = {k: v.to(device) if isinstance(v, torch.Tensor) else v for k, v in inputs.items()}
     
-    # Forward pass
-    with torch.no_grad():
-        logits = wav2vec(**inputs).logits
-    
-    # Get predicted tokens
-    predicted_ids = torch.argmax(logits, dim=-1)[0]
-    tokens = processor.tokenizer.convert_ids_to_tokens(predicted_ids.tolist())
-    
-    # Convert tokens to events
-    events = []
-    current = None
+    # On CUDA, copy and forward on a dedicated stream so the kernels can
+    # interleave with Whisper's, which runs on the default stream in
+    # another thread during analyze_speech
+    stream_ctx = (
+        torch.cuda.stream(_wav2vec_stream(device.index, stream_slot))
+        if device.type == "cuda" else contextlib.nullcontext()
+    )
     
-    for i, tok in enumerate(tokens):
-        t = i * FRAME_SEC
+    with stream_ctx:
+        # Ensure model and inputs are on the same device
+        inputs = {k: v.to(device) if isinstance(v, torch.Tensor) else v for k, v in inputs.items()}
+        
+        # Forward pass; on CUDA under fp16 autocast (tensor cores), weights stay fp32
+        with torch.inference_mode(), torch.autocast(
+            device.type, dtype=torch.float16, enabled=device.type == "cuda"
+        ):
+            logits = wav2vec(**inputs).logits
         
-        if tok == '<pad>':
-            if current:
-                current["end"] = t
-                events.append(current)
-                current = None
+        # Collapse frame-level CTC ids into runs natively, then resolve only
+        # the run labels to token strings (.cpu() waits for this stream)
+        predicted_ids = torch.argmax(logits, dim=-1)[0].cpu().numpy().astype(np.int64)
+    tokenizer = processor.tokenizer
+    pad_id = tokenizer.convert_tokens_to_ids('<pad>')
+    if tokenizer.convert_ids_to_tokens(pad_id) != '<pad>':
+        pad_id = -1
+    
+    run_start, run_end, run_ids = _ctc_token_runs(predicted_ids, pad_id)
+    # The vocabulary is tiny, so resolve each distinct id once and index
+    uniq_ids, inverse = np.unique(run_ids, return_inverse=True)
+    uniq_labels = tokenizer.convert_ids_to_tokens(uniq_ids.tolist())
+    labels = [uniq_labels[i] for i in inverse.tolist()]
+    starts = (offset + run_start * FRAME_SEC).tolist()
+    ends = (offset + run_end * FRAME_SEC).tolist()
+    
+    return [
+        {"label": label, "start": start, "end": end}
+        for label, start, end in zip(labels, starts, ends)
+    ]
+
+
+@njit(cache=True)
+def _ctc_token_runs(ids: np.ndarray, pad_id: int):
+    """
+    Scan frame-level CTC ids and return (start_frame, end_frame, id) per run.
+    
+    A run is a stretch of one repeated non-pad id. It ends at the frame of
+    the next pad or different id; a run still open at the end closes on the
+    last frame.
+    """
+    n = ids.shape[0]
+    run_start = np.empty(n, dtype=np.int64)
+    run_end = np.empty(n, dtype=np.int64)
+    run_ids = np.empty(n, dtype=np.int64)
+    k = 0
+    is_open = False
+    
+    for i in range(n):
+        tok = ids[i]
+        if tok == pad_id:
+            if is_open:
+                run_end[k] = i
+                k += 1
+                is_open = False
             continue
         
-        if current and current["label"] == tok:
+        if is_open and run_ids[k] == tok:
             continue
         
-        if current:
-            current["end"] = t
-            events.append(current)
+        if is_open:
+            run_end[k] = i
+            k += 1
         
-        current = {"label": tok, "start": t}
+        run_start[k] = i
+        run_ids[k] = tok
+        is_open = True
     
-    if current:
-        current["end"] = t
-        events.append(current)
+    if is_open:
+        run_end[k] = n - 1
+        k += 1
     
-    df = pd.DataFrame(events)
-    if df.empty:
-        return df
+    return run_start[:k], run_end[:k], run_ids[:k]
+
+
+def _wav2vec_events_parallel(
+    processor,
+    wav2vec,
+    waveform,
+    chunk_sec: float = 30.0,
+    overlap_sec: float = 0.5,
+    workers: int = 4
+) -> list:
+    """
+    Shard a long waveform into overlapping windows and decode them.
     
-    df["duration"] = df["end"] - df["start"]
-    df["labels"] = df["label"]
+    Each window owns the events that *start* inside its non-overlapping
+    [i * chunk_sec, (i + 1) * chunk_sec) span (compared in samples, so
+    float offsets can't drop or duplicate an event at a boundary); the
+    overlap only gives the model context at the edges.
     
-    # Merge adjacent same-label events
-    df = merge_adjacent_events(df)
+    On CPU the windows run one after another: a single forward already
+    uses every intra-op thread, so concurrent forwards would only
+    oversubscribe the cores and multiply activation memory. On CUDA up to
+    ``workers`` windows run concurrently, each worker thread on its own
+    side stream.
     
-    return df
+    Args:
+        processor: Wav2Vec2Processor
+        wav2vec: Wav2Vec2ForCTC model
+        waveform: 1-D 16kHz waveform tensor
+        chunk_sec: Owned span per window in seconds
+        overlap_sec: Extra context on each side of a window in seconds
+        workers: Maximum number of windows decoded at once on CUDA
+        
+    Returns:
+        List of {"label", "start", "end"} dicts sorted by start
+    """
+    import itertools
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    
+    sr = 16000
+    total = waveform.shape[-1]
+    step = int(chunk_sec * sr)
+    pad = int(overlap_sec * sr)
+    local = threading.local()
+    
+    def run_window(own_start: int) -> list:
+        lo = max(own_start - pad, 0)
+        hi = min(own_start + step + pad, total)
+        window_events = _wav2vec_events(
+            processor, wav2vec, waveform[lo:hi], offset=lo / sr,
+            stream_slot=getattr(local, "slot", 0)
+        )
+        own_end = min(own_start + step, total)
+        return [e for e in window_events if own_start <= round(e["start"] * sr) < own_end]
+    
+    starts = range(0, total, step)
+    if next(wav2vec.parameters()).device.type != "cuda":
+        chunks = [run_window(own_start) for own_start in starts]
+    else:
+        slots = itertools.count()
+        
+        def assign_slot() -> None:
+            local.slot = next(slots)
+        
+        with ThreadPoolExecutor(max_workers=workers, initializer=assign_slot) as pool:
+            chunks = list(pool.map(run_window, starts))
+    
+    return [e for chunk in chunks for e in chunk]
 
 
 def merge_adjacent_events(df: pd.DataFrame, max_gap: float = 0.05) -> pd.DataFrame:
@@ -317,28 +580,37 @@ def merge_adjacent_events(df: pd.DataFrame, max_gap: float = 0.05) -> pd.DataFra
     if df.empty:
         return df
     
+    df = df.sort_values("start")
+    columns = list(df.columns)
+    i_label = columns.index("labels")
+    i_start = columns.index("start")
+    i_end = columns.index("end")
+    
+    # Plain tuples avoid building a Series per row
     merged = []
     current = None
     
-    for _, row in df.sort_values("start").iterrows():
+    for row in df.itertuples(index=False, name=None):
         if current is None:
-            current = row.to_dict()
+            current = list(row)
             continue
         
-        same_label = row["labels"] == current["labels"]
-        close = row["start"] - current["end"] <= max_gap
+        same_label = row[i_label] == current[i_label]
+        close = row[i_start] - current[i_end] <= max_gap
         
         if same_label and close:
-            current["end"] = row["end"]
-            current["duration"] = current["end"] - current["start"]
+            current[i_end] = row[i_end]
         else:
             merged.append(current)
-            current = row.to_dict()
+            current = list(row)
     
     if current:
         merged.append(current)
     
-    return pd.DataFrame(merged)
+    df_merged = pd.DataFrame(merged, columns=columns)
+    # Durations of extended events are refreshed in one pass at the end
+    df_merged["duration"] = df_merged["end"] - df_merged["start"]
+    return df_merged
 
 
 # ==============================
@@ -352,88 +624,90 @@ def overlaps_any_word_relaxed(
     tol_before: float = 0.02,
     tol_after: float = 0.02
 ) -> bool:
-    """Check if time range overlaps any word."""
-    for _, w in words.iterrows():
-        if start < w["end"] + tol_after and end > w["start"] - tol_before:
-            return True
-    return False
+    """
+    Check if time range overlaps any word.
+    
+    Also accepts arrays of event bounds and returns a boolean mask. Words
+    are sorted by (widened) start once; an event overlaps a word iff, among
+    the words starting before the event ends (found by binary search), the
+    latest widened end is after the event starts. Cost is
+    O((events + words) log words) rather than events x words.
+    """
+    word_start = words["start"].to_numpy(dtype=float) - tol_before
+    word_end = words["end"].to_numpy(dtype=float) + tol_after
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    
+    # Words with a NaN bound never compare as overlapping
+    valid = ~(np.isnan(word_start) | np.isnan(word_end))
+    if not valid.all():
+        word_start = word_start[valid]
+        word_end = word_end[valid]
+    
+    if word_start.size == 0:
+        overlap = np.zeros(start.shape, dtype=bool)
+    else:
+        order = np.argsort(word_start, kind="stable")
+        sorted_start = word_start[order]
+        # Running max of widened ends over words in start order
+        max_end = np.maximum.accumulate(word_end[order])
+        n_before = np.searchsorted(sorted_start, end, side="left")
+        overlap = (n_before > 0) & (max_end[np.maximum(n_before - 1, 0)] > start)
+    
+    return overlap if overlap.ndim else bool(overlap)
 
 
 def is_word_initial_candidate(
-    row: pd.Series,
+    end: float,
     word_starts: pd.DataFrame,
     max_lead: float = WORD_ONSET_WINDOW
 ) -> bool:
-    """Check if event is immediately before a word start."""
-    end = row["end"]
-    upcoming = word_starts[
-        (word_starts["start"] >= end) &
-        ((word_starts["start"] - end) <= max_lead)
-    ]
-    return not upcoming.empty
-
-
-def looks_like_filler(norm: str, duration: float) -> bool:
-    """Check if normalized label looks like a filler sound."""
-    if duration < MIN_FILLER_DURATION:
-        return False
+    """
+    Check if event is immediately before a word start.
     
-    # Vowel hesitations (uh, ah, eh)
-    if re.fullmatch(r"[AEIOUH]+", norm):
-        return True
+    Also accepts an array of event end times and returns a boolean mask.
+    The next word start is found by binary search instead of a full scan.
+    """
+    starts = np.sort(word_starts["start"].to_numpy(dtype=float))
+    end = np.asarray(end, dtype=float)
     
-    # Nasal hums (mm, nn)
-    if re.fullmatch(r"M+|N+", norm):
-        return True
+    if starts.size == 0:
+        is_initial = np.zeros(end.shape, dtype=bool)
+    else:
+        idx = np.searchsorted(starts, end, side="left")
+        next_start = starts[np.minimum(idx, starts.size - 1)]
+        is_initial = (idx < starts.size) & ((next_start - end) <= max_lead)
     
-    return False
+    return is_initial if is_initial.ndim else bool(is_initial)
 
 
-def should_suppress_word_initial(row: pd.Series) -> bool:
-    """Check if word-initial sound should be suppressed."""
-    label = row["labels"].upper()
-    norm = re.sub(r"(.)\1+", r"\1", label)
-    
-    # Never suppress filler-shaped sounds
-    if looks_like_filler(norm, row["duration"]):
-        return False
-    
-    # Suppress only ultra-short junk
-    return row["duration"] < 0.03
+def looks_like_filler_mask(norm: pd.Series, duration: np.ndarray) -> np.ndarray:
+    """Flag filler-shaped labels (vowel hesitations, nasal hums) of sufficient duration."""
+    is_shape = norm.str.fullmatch(_FILLER_SHAPE_REGEX).fillna(False).to_numpy(dtype=bool)
+    return (duration >= MIN_FILLER_DURATION) & is_shape
 
 
-def classify_non_word_event(row: pd.Series) -> dict:
-    """Classify a non-word phoneme event as filler or stutter."""
-    label = row["labels"].upper()
-    duration = row["duration"]
-    norm = re.sub(r"(.)\1+", r"\1", label)
-    
-    # Fillers
-    if looks_like_filler(norm, duration):
-        return {
-            "type": "filler",
-            "raw_label": label,
-            "text": FILLER_MAP.get(norm, "uh"),
-        }
+def dedup_labels(label: pd.Series) -> pd.Series:
+    """
+    Collapse repeated characters (``AAA`` -> ``A``) across a label column.
     
-    # Stutters
-    if (
-        norm in STUTTER_CONSONANTS
-        and norm not in FILLER_MAP
-        and duration < 0.15
-    ):
-        return {
-            "type": "stutter",
-            "raw_label": label,
-            "text": norm.lower(),
-        }
+    The backreference in _DEDUP has no RE2 equivalent, so it stays on
+    Python's re, but only for labels that can contain a run at all; CTC
+    tokens are almost always a single character.
+    """
+    multi = (label.str.len() > 1).fillna(False).to_numpy(dtype=bool)
+    if not multi.any():
+        return label
     
-    return None
+    norm = label.copy()
+    norm[multi] = label[multi].str.replace(_DEDUP, r"\1", regex=True)
+    return norm
 
 
 def detect_fillers_wav2vec(
     audio_path: str,
-    df_aligned_words: pd.DataFrame
+    df_aligned_words: pd.DataFrame,
+    df_wav2vec: pd.DataFrame = None
 ) -> pd.DataFrame:
     """
     Detect fillers and stutters using Wav2Vec2 phoneme detection.
@@ -441,20 +715,24 @@ def detect_fillers_wav2vec(
     Args:
         audio_path: Path to audio file
         df_aligned_words: DataFrame with aligned word timestamps
+        df_wav2vec: Optional phoneme events already produced by
+            detect_phonemes_wav2vec (skips a second forward pass)
         
     Returns:
         DataFrame with detected filler/stutter events
     """
     # Get phoneme-level events
-    df_wav2vec = detect_phonemes_wav2vec(audio_path)
+    if df_wav2vec is None:
+        df_wav2vec = detect_phonemes_wav2vec(audio_path)
     
     if df_wav2vec.empty:
         return pd.DataFrame()
     
     # Filter out word overlaps
-    df_wav2vec["overlaps_word"] = df_wav2vec.apply(
-        lambda r: overlaps_any_word_relaxed(r["start"], r["end"], df_aligned_words),
-        axis=1
+    df_wav2vec["overlaps_word"] = overlaps_any_word_relaxed(
+        df_wav2vec["start"].to_numpy(),
+        df_wav2vec["end"].to_numpy(),
+        df_aligned_words,
     )
     
     df_non_word = df_wav2vec.loc[~df_wav2vec["overlaps_word"]].copy()
@@ -462,14 +740,18 @@ def detect_fillers_wav2vec(
     # Handle word-initial sounds
     word_starts = df_aligned_words[["start"]].copy()
     
-    df_non_word["is_word_initial"] = df_non_word.apply(
-        lambda r: is_word_initial_candidate(r, word_starts),
-        axis=1
+    df_non_word["is_word_initial"] = is_word_initial_candidate(
+        df_non_word["end"].to_numpy(), word_starts
     )
     
-    df_non_word["suppress"] = df_non_word.apply(
-        lambda r: r["is_word_initial"] and should_suppress_word_initial(r),
-        axis=1
+    # Suppress ultra-short, non-filler-shaped word-initial junk
+    df_non_word["labels"] = df_non_word["labels"].astype(_LABEL_DTYPE)
+    norm = dedup_labels(df_non_word["labels"].str.upper())
+    duration = df_non_word["duration"].to_numpy(dtype=float)
+    df_non_word["suppress"] = (
+        df_non_word["is_word_initial"].to_numpy(dtype=bool)
+        & ~looks_like_filler_mask(norm, duration)
+        & (duration < 0.03)
     )
     
     df_non_word = df_non_word.loc[~df_non_word["suppress"]].reset_index(drop=True)
@@ -477,24 +759,44 @@ def detect_fillers_wav2vec(
     # Merge micro events
     df_non_word = merge_adjacent_events(df_non_word, max_gap=0.05)
     
-    # Classify events
-    converted = []
-    for _, row in df_non_word.iterrows():
-        result = classify_non_word_event(row)
-        if result:
-            converted.append({
-                "type": result["type"],
-                "text": result["text"],
-                "raw_label": result["raw_label"],
-                "word": result["text"],  # Use text as word display
-                "start": row["start"],
-                "end": row["end"],
-                "duration": row["duration"],
-                "style": "subtle",  # Wav2Vec2 detections are subtle
-                "confidence": 0.25,  # Wav2Vec2 confidence
-            })
-    
-    return pd.DataFrame(converted)
+    if df_non_word.empty:
+        return pd.DataFrame()
+    
+    # Classify events: filler-shaped sounds are fillers, short lone
+    # consonants are stutters, everything else is dropped
+    label = df_non_word["labels"].astype(_LABEL_DTYPE).str.upper()
+    norm = dedup_labels(label)
+    duration = df_non_word["duration"].to_numpy(dtype=float)
+    
+    is_filler = looks_like_filler_mask(norm, duration)
+    is_stutter = (
+        ~is_filler
+        & norm.isin(STUTTER_CONSONANTS).to_numpy()
+        & ~norm.isin(list(FILLER_MAP)).to_numpy()
+        & (duration < 0.15)
+    )
+    keep = is_filler | is_stutter
+    
+    if not keep.any():
+        return pd.DataFrame()
+    
+    text = np.where(
+        is_filler,
+        norm.map(FILLER_MAP).fillna("uh").to_numpy(dtype=object),
+        norm.str.lower().to_numpy(dtype=object),
+    )[keep]
+    
+    return pd.DataFrame({
+        "type": np.where(is_filler, "filler", "stutter")[keep],
+        "text": text,
+        "raw_label": label.to_numpy(dtype=object)[keep],
+        "word": text,  # Use text as word display
+        "start": df_non_word["start"].to_numpy()[keep],
+        "end": df_non_word["end"].to_numpy()[keep],
+        "duration": duration[keep],
+        "style": "subtle",  # Wav2Vec2 detections are subtle
+        "confidence": 0.25,  # Wav2Vec2 confidence
+    })
 
 
 # ==============================
@@ -511,29 +813,41 @@ def detect_fillers_whisper(verbatim_result: dict) -> pd.DataFrame:
     Returns:
         DataFrame with detected filler words
     """
+    words = [
+        (w["word"], w["start"], w["end"], w["probability"])
+        for seg in verbatim_result.get("segments", [])
+        for w in seg.get("words", [])
+    ]
+    
+    if not words:
+        return pd.DataFrame()
     
-    def normalize_whisper_token(token: str) -> str:
-        token = token.lower().strip()
-        return re.sub(r"^[^\w]+|[^\w]+$", "", token)
+    df = pd.DataFrame(words, columns=["raw_label", "start", "end", "confidence"])
+    df["raw_label"] = df["raw_label"].astype(_LABEL_DTYPE)
     
-    whisper_fillers = []
+    norm = (
+        df["raw_label"].str.lower().str.strip()
+        .str.replace(_EDGE_PUNCT, "", regex=True)
+    )
+    is_filler = norm.str.match(FILLER_REGEX).fillna(False).to_numpy(dtype=bool)
     
-    for seg in verbatim_result.get("segments", []):
-        for w in seg.get("words", []):
-            norm = normalize_whisper_token(w["word"])
-            if norm and FILLER_REGEX.match(norm):
-                whisper_fillers.append({
-                    "style": "clear",
-                    "type": "filler",
-                    "text": norm,
-                    "raw_label": w["word"],
-                    "start": float(w["start"]),
-                    "end": float(w["end"]),
-                    "duration": float(w["end"] - w["start"]),
-                    "confidence": float(w["probability"]),
-                })
+    if not is_filler.any():
+        return pd.DataFrame()
     
-    return pd.DataFrame(whisper_fillers)
+    df = df.loc[is_filler].reset_index(drop=True)
+    start = df["start"].to_numpy(dtype=float)
+    end = df["end"].to_numpy(dtype=float)
+    
+    return pd.DataFrame({
+        "style": "clear",
+        "type": "filler",
+        "text": norm.to_numpy(dtype=object)[is_filler],
+        "raw_label": df["raw_label"].to_numpy(dtype=object),
+        "start": start,
+        "end": end,
+        "duration": end - start,
+        "confidence": df["confidence"].to_numpy(dtype=float),
+    })
 
 
 # ==============================
@@ -551,6 +865,29 @@ def overlaps_time(
     return (a_start < b_end + tol) and (a_end > b_start - tol)
 
 
+@njit(cache=True)
+def _suppress_by_reach(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    suppressed: np.ndarray,
+    tol: float
+) -> None:
+    """
+    Mark events (sorted by start) that overlap an earlier kept event.
+    
+    Updates ``suppressed`` in place; rows already suppressed are skipped and
+    do not extend the reach.
+    """
+    reach = -np.inf
+    for i in range(starts.shape[0]):
+        if suppressed[i]:
+            continue
+        if starts[i] < reach + tol:
+            suppressed[i] = True
+        elif ends[i] > reach:
+            reach = ends[i]
+
+
 def merge_filler_detections(
     df_whisper: pd.DataFrame,
     df_wav2vec: pd.DataFrame
@@ -566,33 +903,39 @@ def merge_filler_detections(
     Returns:
         Combined DataFrame with all filler events
     """
-    final_fillers = []
-    
-    # Add all Whisper detections first
-    for _, wf in df_whisper.iterrows():
-        final_fillers.append(wf.to_dict())
+    tol = 0.05  # Same tolerance as overlaps_time
     
-    # Add Wav2Vec2 detections that don't overlap
-    for _, row in df_wav2vec.iterrows():
-        duplicate = False
+    if not df_wav2vec.empty:
+        df_wav2vec = df_wav2vec.sort_values("start", kind="stable")
+        w2v_start = df_wav2vec["start"].to_numpy(dtype=float)
+        w2v_end = df_wav2vec["end"].to_numpy(dtype=float)
         
-        for af in final_fillers:
-            if overlaps_time(row["start"], row["end"], af["start"], af["end"]):
-                duplicate = True
-                break
+        # Overlap with Whisper detections: the same sorted interval join used
+        # for word overlaps, with the tolerance on both sides
+        if df_whisper.empty:
+            duplicate = np.zeros(len(df_wav2vec), dtype=bool)
+        else:
+            duplicate = overlaps_any_word_relaxed(
+                w2v_start, w2v_end, df_whisper, tol_before=tol, tol_after=tol
+            )
+        
+        # Overlap with earlier accepted Wav2Vec2 events (sorted by start, so only
+        # the furthest end reached so far matters)
+        _suppress_by_reach(w2v_start, w2v_end, duplicate, tol)
         
-        if not duplicate:
-            entry = row.to_dict()
-            # Ensure all required columns are present
-            if "style" not in entry:
-                entry["style"] = "subtle"
-            if "confidence" not in entry:
-                entry["confidence"] = 0.25
-            if "word" not in entry:
-                entry["word"] = entry.get("text", "")
-            final_fillers.append(entry)
-    
-    df = pd.DataFrame(final_fillers)
+        df_wav2vec = df_wav2vec.loc[~duplicate].copy()
+        
+        # Ensure all required columns are present
+        if "style" not in df_wav2vec.columns:
+            df_wav2vec["style"] = "subtle"
+        if "confidence" not in df_wav2vec.columns:
+            df_wav2vec["confidence"] = 0.25
+        if "word" not in df_wav2vec.columns:
+            df_wav2vec["word"] = df_wav2vec.get("text", "")
+    
+    # Whisper detections first, then non-overlapping Wav2Vec2 detections
+    frames = [f for f in (df_whisper, df_wav2vec) if not f.empty]
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
     
     if not df.empty:
         df = df.sort_values("start").reset_index(drop=True)
@@ -632,46 +975,57 @@ def group_stutters(df_fillers: pd.DataFrame) -> pd.DataFrame:
     if df_stutters.empty:
         return df_fillers
     
-    grouped = []
-    current = None
-    
-    for _, row in df_stutters.sort_values("start").iterrows():
-        if current is None:
-            current = row.to_dict()
-            current["count"] = 1
-            continue
-        
-        same_sound = row.get("raw_label") == current.get("raw_label")
-        close_in_time = row["start"] - current["end"] <= GROUP_GAP_SEC
-        
-        if same_sound and close_in_time:
-            current["end"] = row["end"]
-            current["duration"] = current["end"] - current["start"]
-            current["count"] += 1
-        else:
-            grouped.append(current)
-            current = row.to_dict()
-            current["count"] = 1
-    
-    if current:
-        grouped.append(current)
-    
-    df_grouped_stutters = pd.DataFrame(grouped)
+    # Run-length grouping: a new group starts wherever the sound changes or
+    # the gap to the previous stutter exceeds GROUP_GAP_SEC
+    df_stutters = df_stutters.sort_values("start", kind="stable").reset_index(drop=True)
+    starts = df_stutters["start"].to_numpy(dtype=float)
+    ends = df_stutters["end"].to_numpy(dtype=float)
+    
+    if "raw_label" in df_stutters.columns:
+        raw_labels = df_stutters["raw_label"].to_numpy(dtype=object)
+        same_sound = raw_labels[1:] == raw_labels[:-1]
+    else:
+        same_sound = np.ones(len(df_stutters) - 1, dtype=bool)
+    close_in_time = (starts[1:] - ends[:-1]) <= GROUP_GAP_SEC
+    
+    new_group = np.concatenate([[True], ~(same_sound & close_in_time)])
+    first_idx = np.flatnonzero(new_group)
+    last_idx = np.append(first_idx[1:] - 1, len(df_stutters) - 1)
+    count = last_idx - first_idx + 1
+    
+    # Each group keeps its first row, extended to the last repetition's end
+    df_grouped_stutters = df_stutters.iloc[first_idx].reset_index(drop=True)
+    df_grouped_stutters["end"] = ends[last_idx]
+    df_grouped_stutters["duration"] = np.where(
+        count > 1,
+        ends[last_idx] - starts[first_idx],
+        df_grouped_stutters["duration"].to_numpy(),
+    )
+    df_grouped_stutters["count"] = count
+    
+    # Filter out very short single stutters (only grouped rows can be stutters)
+    duration = df_grouped_stutters["duration"].to_numpy(dtype=float)
+    df_grouped_stutters = df_grouped_stutters.loc[~((count < 2) & (duration < 0.15))]
+    
+    # Combine with other events: both sides are sorted by start, so interleave
+    # them with one searchsorted instead of re-sorting the concatenation
+    if not df_other["start"].is_monotonic_increasing:
+        df_other = df_other.sort_values("start", kind="stable")
+    other_start = df_other["start"].to_numpy(dtype=float)
+    grouped_start = df_grouped_stutters["start"].to_numpy(dtype=float)
+    
+    n_other, n_grouped = len(other_start), len(grouped_start)
+    grouped_pos = np.searchsorted(other_start, grouped_start, side="right") + np.arange(n_grouped)
+    take = np.empty(n_other + n_grouped, dtype=np.intp)
+    is_grouped = np.zeros(n_other + n_grouped, dtype=bool)
+    is_grouped[grouped_pos] = True
+    take[grouped_pos] = n_other + np.arange(n_grouped)
+    take[~is_grouped] = np.arange(n_other)
     
-    # Combine with other events
     df_final = (
         pd.concat([df_other, df_grouped_stutters], ignore_index=True)
-        .sort_values("start")
+        .take(take)
         .reset_index(drop=True)
     )
     
-    # Filter out very short single stutters
-    df_final = df_final[
-        ~(
-            (df_final["type"] == "stutter") &
-            (df_final["count"].fillna(1) < 2) &
-            (df_final["duration"] < 0.15)
-        )
-    ].reset_index(drop=True)
-    
     return df_final
@@ -1,13 +1,19 @@
 # src/audio/processing.py
 """Audio loading and transcription utilities with error handling."""
+import contextlib
+import multiprocessing
 import os
 import soundfile as sf
 import pandas as pd
 import numpy as np
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from math import gcd
 from pathlib import Path
-from typing import Tuple, Dict, Set, Any
+from typing import Tuple, Dict, Set, Any, List, Optional, Union
 from src.utils.config import CORE_FILLERS, FILLER_PATTERNS
 from src.utils.exceptions import (
     AudioNotFoundError,
@@ -23,6 +29,10 @@ from src.utils.logging_config import logger
 
 MIN_AUDIO_DURATION_SEC = 5.0
 
+# Whisper installs per-call KV-cache hooks on the model while decoding, so a
+# cached model instance must not transcribe two files at the same time.
+_WHISPER_LOCK = threading.Lock()
+
 
 def convert_webm_to_wav(webm_path: str) -> str:
     """
@@ -79,6 +89,63 @@ def convert_webm_to_wav(webm_path: str) -> str:
         )
 
 
+def read_mono_float32(path: str, blocksize: int = 1 << 16) -> Tuple[np.ndarray, int]:
+    """
+    Read an audio file block by block, downmixing to mono as it goes.
+    
+    Each block is averaged straight into a preallocated float32 buffer, so
+    the full multi-channel signal is never held in memory at once.
+    
+    Args:
+        path: Path to audio file
+        blocksize: Frames decoded per block
+        
+    Returns:
+        Tuple of (mono float32 audio, sample_rate)
+    """
+    with sf.SoundFile(path) as f:
+        sr = f.samplerate
+        audio = np.empty(max(f.frames, 0), dtype=np.float32)
+        pos = 0
+        
+        for block in f.blocks(blocksize=blocksize, dtype="float32", always_2d=True):
+            n = block.shape[0]
+            if pos + n > audio.size:
+                # Frame count in the header was short; grow the buffer
+                audio = np.concatenate([audio[:pos], np.empty(n, dtype=np.float32)])
+            
+            if block.shape[1] == 1:
+                audio[pos:pos + n] = block[:, 0]
+            else:
+                np.mean(block, axis=1, out=audio[pos:pos + n])
+            pos += n
+    
+    return audio[:pos], sr
+
+
+def resample_to_16k(audio: np.ndarray, sr: int) -> np.ndarray:
+    """
+    Resample mono float32 audio to 16kHz.
+    
+    Uses soxr (installed with librosa) when available, falling back to a
+    scipy polyphase filter. Both stay in NumPy, avoiding a torch round-trip.
+    
+    Args:
+        audio: Mono float32 audio
+        sr: Source sample rate
+        
+    Returns:
+        Mono float32 audio at 16kHz
+    """
+    try:
+        import soxr
+        return soxr.resample(audio, sr, 16000, quality="HQ").astype(np.float32, copy=False)
+    except ImportError:
+        from scipy.signal import resample_poly
+        g = gcd(sr, 16000)
+        return resample_poly(audio, 16000 // g, sr // g).astype(np.float32, copy=False)
+
+
 def load_audio(path: str) -> Tuple[np.ndarray, int]:
     """
     Load audio file and convert to mono 16kHz.
@@ -113,7 +180,7 @@ def load_audio(path: str) -> Tuple[np.ndarray, int]:
             raise
     
     try:
-        audio, sr = sf.read(str(actual_path), dtype="float32")
+        audio, sr = read_mono_float32(str(actual_path))
     except Exception as e:
         # Clean up temp file if conversion was done
         if temp_wav_path and os.path.exists(temp_wav_path):
@@ -127,19 +194,10 @@ def load_audio(path: str) -> Tuple[np.ndarray, int]:
             {"file_path": str(audio_path), "error": str(e)}
         )
     
-    # Convert stereo to mono
-    if audio.ndim == 2:
-        audio = audio.mean(axis=1)
-    
-    # Resample to 16kHz if needed
+    # Resample to 16kHz if needed (no torch import required)
     if sr != 16000:
         try:
-            import torch
-            import torchaudio
-            audio_tensor = torch.from_numpy(audio)
-            audio = torchaudio.functional.resample(
-                audio_tensor, sr, 16000
-            ).numpy()
+            audio = resample_to_16k(audio, sr)
             sr = 16000
         except Exception as e:
             raise AudioFormatError(
@@ -173,93 +231,386 @@ def load_audio(path: str) -> Tuple[np.ndarray, int]:
     return audio, sr
 
 
-def transcribe_with_whisper(
-    audio_path: str,
+@lru_cache(maxsize=4)
+def _get_whisper_model(model_name: str, device: str, cache_dir: Optional[str]):
+    """Load a Whisper model once per (model, device, cache_dir) and reuse it."""
+    import whisper
+    
+    # Avoid meta device issues by disabling in_memory optimization
+    os.environ["TORCH_CUDNN_ENABLED"] = "1"
+    
+    try:
+        model = whisper.load_model(model_name, device=device, download_root=cache_dir, in_memory=False)
+    except TypeError:
+        # Older Whisper versions don't support in_memory parameter
+        model = whisper.load_model(model_name, device=device, download_root=cache_dir)
+    
+    if device == "cpu":
+        model = _quantize_linear_int8(model)
+    
+    logger.info(f"Loaded Whisper model: {model_name} on {device}")
+    return model
+
+
+def _to_plain_linear(module) -> None:
+    """
+    Replace whisper.model.Linear layers with plain nn.Linear, in place.
+    
+    quantize_dynamic only converts exact nn.Linear modules, and Whisper's
+    subclass (which just casts weights to the input dtype) fails that check.
+    The plain layers reuse the same weight and bias parameters.
+    """
+    import torch
+    from whisper.model import Linear as WhisperLinear
+    
+    for name, child in module.named_children():
+        if isinstance(child, WhisperLinear):
+            plain = torch.nn.Linear(
+                child.in_features, child.out_features, bias=child.bias is not None
+            )
+            plain.weight = child.weight
+            plain.bias = child.bias
+            setattr(module, name, plain)
+        else:
+            _to_plain_linear(child)
+
+
+def _quantize_linear_int8(model):
+    """
+    Dynamic-quantize Whisper's Linear layers to int8 for CPU inference.
+    
+    CPU decoding is memory-bound on the linear weights, so int8 roughly
+    halves weight traffic. Falls back to the fp32 model if torch or the
+    quantized backend is unavailable.
+    """
+    try:
+        import torch
+        from torch.ao.quantization import quantize_dynamic
+    except ImportError as e:
+        logger.warning(f"int8 quantization unavailable, using fp32 Whisper model: {e}")
+        return model
+    
+    _to_plain_linear(model)
+    try:
+        return quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except RuntimeError as e:
+        # No quantized engine for this CPU/build (e.g. "NoQEngine")
+        logger.warning(f"int8 quantization unavailable, using fp32 Whisper model: {e}")
+        return model
+
+
+@lru_cache(maxsize=4)
+def _get_align_model(language_code: str, device: str):
+    """Load a WhisperX alignment model once per (language, device) and reuse it."""
+    import whisperx
+    
+    align_model, metadata = whisperx.load_align_model(
+        language_code=language_code,
+        device=device
+    )
+    logger.info(f"Loaded WhisperX alignment model for {language_code}")
+    return align_model, metadata
+
+
+def clear_model_cache() -> None:
+    """
+    Drop cached Whisper/faster-whisper/WhisperX/Wav2Vec2 models.
+    
+    Long-running services can call this to evict models; on CUDA the
+    allocator cache is released as well so the memory returns to the device.
+    """
+    # filler_detection imports this module, so its loader is reached lazily
+    from src.audio.filler_detection import _get_wav2vec_models
+    
+    _get_whisper_model.cache_clear()
+    _get_faster_whisper_model.cache_clear()
+    _get_align_model.cache_clear()
+    _get_wav2vec_models.cache_clear()
+    
+    try:
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except Exception:
+        pass
+
+
+def _whisper_backend() -> str:
+    """Return the configured Whisper backend ('openai' or 'faster-whisper')."""
+    return os.getenv("WHISPER_BACKEND", "openai").strip().lower()
+
+
+def _resolve_device(device: str) -> str:
+    """Fall back to CPU when CUDA is requested but unavailable."""
+    try:
+        import torch
+        if device == "cuda" and not torch.cuda.is_available():
+            logger.warning("CUDA requested but not available, falling back to CPU")
+            device = "cpu"
+    except Exception:
+        device = "cpu"
+    return device
+
+
+@lru_cache(maxsize=4)
+def _get_faster_whisper_model(
+    model_name: str,
+    device: str,
+    cache_dir: Optional[str],
+    compute_type: Optional[str] = None
+):
+    """Load a faster-whisper (CTranslate2) model once per (model, device, cache_dir, compute_type)."""
+    from faster_whisper import WhisperModel
+    
+    if compute_type is None:
+        compute_type = "float16" if device == "cuda" else "int8"
+    model = WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        download_root=cache_dir
+    )
+    logger.info(f"Loaded faster-whisper model: {model_name} on {device} ({compute_type})")
+    return model
+
+
+def _faster_whisper_transcribe(
+    model,
+    audio: Union[str, np.ndarray],
+    initial_prompt: Optional[str],
+    word_timestamps: bool,
+    **decode_options: Any
+) -> Dict[str, Any]:
+    """
+    Run faster-whisper and convert its Segment generator to the dict shape
+    returned by openai-whisper, so extract_*_dataframe work unchanged.
+    """
+    segments_iter, info = model.transcribe(
+        audio,
+        initial_prompt=initial_prompt,
+        word_timestamps=word_timestamps,
+        **decode_options
+    )
+    
+    segments = []
+    for seg in segments_iter:
+        entry = {
+            "id": seg.id,
+            "start": float(seg.start),
+            "end": float(seg.end),
+            "text": seg.text,
+            "avg_logprob": seg.avg_logprob,
+            "no_speech_prob": seg.no_speech_prob,
+        }
+        if seg.words is not None:
+            entry["words"] = [
+                {
+                    "word": w.word,
+                    "start": float(w.start),
+                    "end": float(w.end),
+                    "probability": float(w.probability),
+                }
+                for w in seg.words
+            ]
+        segments.append(entry)
+    
+    return {
+        "text": "".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "language": info.language,
+    }
+
+
+def transcribe(
+    audio_or_path: Union[str, np.ndarray],
+    initial_prompt: Optional[str] = None,
+    word_timestamps: bool = True,
     model_name: str = "base",
-    device: str = "cpu"
+    device: str = "cpu",
+    compute_type: Optional[str] = None,
+    **decode_options: Any
 ) -> Dict[str, Any]:
     """
-    Transcribe audio using Whisper with word timestamps.
+    Run a single Whisper pass against the cached model for this process.
+    
+    The backend is chosen by the WHISPER_BACKEND environment variable:
+    'openai' (default, reference implementation) or 'faster-whisper'
+    (CTranslate2, float16 on CUDA / int8 on CPU unless compute_type is
+    given). Both return the same openai-whisper result shape. The
+    reference backend decodes in fp16 on CUDA and fp32 on CPU.
+    
+    Passing the 16kHz mono float32 array from load_audio skips the second
+    ffmpeg decode and resample Whisper would otherwise do on the path.
     
     Args:
-        audio_path: Path to audio file
+        audio_or_path: Path to audio file, or a 16kHz mono float32 array
+        initial_prompt: Optional decoder prompt
+        word_timestamps: Whether to produce word-level timestamps
         model_name: Whisper model size (tiny, base, small, medium, large)
         device: Device to run on ('cpu' or 'cuda')
+        compute_type: faster-whisper compute type (e.g. 'float16', 'int8_float16')
+        **decode_options: Extra decoding options passed to the backend
         
     Returns:
-        Dictionary with segments and word-level timestamps
+        Dictionary with segments and (optionally) word-level timestamps
         
     Raises:
-        ModelLoadError: If Whisper model fails to load
+        ModelLoadError: If the model fails to load
         TranscriptionError: If transcription fails
-        DeviceError: If device is unavailable
     """
-    # Validate device availability
-    try:
-        import torch
-        if device == "cuda" and not torch.cuda.is_available():
-            logger.warning("CUDA requested but not available, falling back to CPU")
-            device = "cpu"
-    except Exception:
-        device = "cpu"
+    device = _resolve_device(device)
+    backend = _whisper_backend()
+    cache_dir = os.getenv("WHISPER_DOWNLOAD_ROOT", None)
     
-    # Load model
     try:
-        import whisper
-        # Use cache directory from environment or default
-        cache_dir = os.getenv("WHISPER_DOWNLOAD_ROOT", None)
-        
-        # Avoid meta device issues by disabling in_memory optimization
-        os.environ["TORCH_CUDNN_ENABLED"] = "1"
-        
-        model = whisper.load_model(model_name, device=device, download_root=cache_dir, in_memory=False)
-        logger.info(f"Loaded Whisper model: {model_name} on {device}")
-    except TypeError:
-        # Older Whisper versions don't support in_memory parameter
-        try:
-            model = whisper.load_model(model_name, device=device, download_root=cache_dir)
-            logger.info(f"Loaded Whisper model: {model_name} on {device}")
-        except Exception as e:
-            raise ModelLoadError(
-                f"Failed to load Whisper model {model_name}: {str(e)}",
-                {"model": model_name, "device": device, "error": str(e)}
-            )
+        if backend == "faster-whisper":
+            model = _get_faster_whisper_model(model_name, device, cache_dir, compute_type)
+        else:
+            model = _get_whisper_model(model_name, device, cache_dir)
     except Exception as e:
         raise ModelLoadError(
             f"Failed to load Whisper model {model_name}: {str(e)}",
-            {"model": model_name, "device": device, "error": str(e)}
+            {"model": model_name, "device": device, "backend": backend, "error": str(e)}
         )
     
-    # Transcribe
     try:
-        result = model.transcribe(
-            audio_path,
-            task="transcribe",
-            word_timestamps=True,
-            fp16=False,
-            language="en"
-        )
-        logger.info(f"Transcription completed: {len(result.get('segments', []))} segments")
-        return result
+        if backend == "faster-whisper":
+            # CTranslate2 models are safe to share across threads
+            return _faster_whisper_transcribe(
+                model, audio_or_path, initial_prompt, word_timestamps, **decode_options
+            )
+        
+        with _WHISPER_LOCK:
+            return model.transcribe(
+                audio_or_path,
+                task="transcribe",
+                initial_prompt=initial_prompt,
+                word_timestamps=word_timestamps,
+                fp16=(device == "cuda"),
+                **decode_options
+            )
     except Exception as e:
+        source = audio_or_path if isinstance(audio_or_path, str) else f"<array of {len(audio_or_path)} samples>"
         raise TranscriptionError(
             f"Transcription failed: {str(e)}",
-            {"audio_path": audio_path, "model": model_name, "error": str(e)}
+            {"audio_path": source, "model": model_name, "backend": backend, "error": str(e)}
         )
 
 
+def transcribe_with_whisper(
+    audio_or_path: Union[str, np.ndarray],
+    model_name: str = "base",
+    device: str = "cpu",
+    compute_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Transcribe audio using Whisper with word timestamps.
+    
+    Args:
+        audio_or_path: Path to audio file, or a 16kHz mono float32 array
+        model_name: Whisper model size (tiny, base, small, medium, large)
+        device: Device to run on ('cpu' or 'cuda')
+        compute_type: faster-whisper compute type (ignored by the openai backend)
+        
+    Returns:
+        Dictionary with segments and word-level timestamps
+        
+    Raises:
+        ModelLoadError: If Whisper model fails to load
+        TranscriptionError: If transcription fails
+    """
+    result = transcribe(
+        audio_or_path,
+        model_name=model_name,
+        device=device,
+        compute_type=compute_type,
+        language="en"
+    )
+    logger.info(f"Transcription completed: {len(result.get('segments', []))} segments")
+    return result
+
+
+def _init_transcribe_worker(threads: int) -> None:
+    """Pin each pool worker's intra-op threads so workers don't oversubscribe cores."""
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except Exception:
+        pass
+
+
+def transcribe_many(
+    paths: List[str],
+    model_name: str = "base",
+    device: str = "cpu",
+    workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Transcribe several audio files, in parallel on CPU.
+    
+    On CPU the files are fanned out over a process pool; each worker loads
+    the model once through the cached loader and reuses it for every file
+    it receives. On CUDA the files run in order against the single cached
+    model, since the decode loop is serialized on one device anyway.
+    
+    Args:
+        paths: Audio file paths
+        model_name: Whisper model size (tiny, base, small, medium, large)
+        device: Device to run on ('cpu' or 'cuda')
+        workers: Number of worker processes (default: half the CPU count)
+        
+    Returns:
+        One transcription result per path, in input order
+        
+    Raises:
+        ModelLoadError: If Whisper model fails to load
+        TranscriptionError: If transcription fails
+    """
+    paths = [str(p) for p in paths]
+    device = _resolve_device(device)
+    
+    if device == "cuda" or len(paths) <= 1:
+        return [transcribe_with_whisper(p, model_name=model_name, device=device) for p in paths]
+    
+    cpus = os.cpu_count() or 2
+    workers = min(workers or max(1, cpus // 2), len(paths))
+    
+    # spawn, not fork: forking a process that already holds torch threads can deadlock
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_transcribe_worker,
+        initargs=(max(1, cpus // workers),)
+    ) as pool:
+        results = list(pool.map(
+            partial(transcribe_with_whisper, model_name=model_name, device=device),
+            paths
+        ))
+    
+    logger.info(f"Transcribed {len(results)} files with {workers} workers")
+    return results
+
+
+VERBATIM_PROMPT = (
+    "Transcribe verbatim. Include filler words like um, uh, er, "
+    "false starts, repetitions, and hesitations."
+)
+
+
 def transcribe_verbatim_fillers(
-    audio_path: str,
+    audio_or_path: Union[str, np.ndarray],
     model_name: str = "base",
-    device: str = "cpu"
+    device: str = "cpu",
+    compute_type: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Transcribe with explicit focus on capturing filler words.
     
     Args:
-        audio_path: Path to audio file
+        audio_or_path: Path to audio file, or a 16kHz mono float32 array
         model_name: Whisper model size
         device: Device to run on
+        compute_type: faster-whisper compute type (ignored by the openai backend)
         
     Returns:
         Dictionary with verbatim transcription including fillers
@@ -268,62 +619,31 @@ def transcribe_verbatim_fillers(
         ModelLoadError: If model fails to load
         TranscriptionError: If transcription fails
     """
-    # Validate device
-    try:
-        import torch
-        if device == "cuda" and not torch.cuda.is_available():
-            logger.warning("CUDA requested but not available, falling back to CPU")
-            device = "cpu"
-    except Exception:
-        device = "cpu"
+    return transcribe(
+        audio_or_path,
+        initial_prompt=VERBATIM_PROMPT,
+        word_timestamps=True,  # Enable on all devices - provides per-word confidence
+        model_name=model_name,
+        device=device,
+        compute_type=compute_type,
+        temperature=0,
+        condition_on_previous_text=False,
+        language="en"
+    )
+
+
+def _align_precision(device: str):
+    """
+    Mixed-precision context for the WhisperX alignment forward passes.
     
-    try:
-        import whisper
+    whisperx.align runs its wav2vec2 CTC model once per segment and has no
+    batch_size option, so on CUDA the per-pass cost is cut with fp16
+    autocast instead. On CPU this is a no-op.
+    """
+    if device == "cuda":
         import torch
-        # Use cache directory from environment or default
-        cache_dir = os.getenv("WHISPER_DOWNLOAD_ROOT", None)
-        
-        # Safest approach: always load on CPU first, then move to target device
-        # This avoids the meta tensor issue in certain PyTorch/Whisper versions
-        try:
-            model = whisper.load_model(model_name, device="cpu", download_root=cache_dir)
-            if device != "cpu":
-                # Use to_empty() for meta tensor compatibility
-                model = model.to_empty(device=device)
-                model = model.to(device)
-        except Exception as e:
-            # Last resort: use in_memory=False if available
-            try:
-                model = whisper.load_model(model_name, device=device, download_root=cache_dir, in_memory=False)
-            except TypeError:
-                # Very old Whisper versions - just try direct load
-                model = whisper.load_model(model_name, device=device, download_root=cache_dir)
-    except Exception as e:
-        raise ModelLoadError(
-            f"Failed to load Whisper model: {str(e)}",
-            {"model": model_name, "device": device}
-        )
-    
-    try:
-        result = model.transcribe(
-            audio_path,
-            task="transcribe",
-            temperature=0,
-            word_timestamps=True,  # Enable on all devices - provides per-word confidence
-            condition_on_previous_text=False,
-            initial_prompt=(
-                "Transcribe verbatim. Include filler words like um, uh, er, "
-                "false starts, repetitions, and hesitations."
-            ),
-            fp16=False,
-            language="en"
-        )
-        return result
-    except Exception as e:
-        raise TranscriptionError(
-            f"Verbatim transcription failed: {str(e)}",
-            {"audio_path": audio_path, "error": str(e)}
-        )
+        return torch.autocast("cuda", dtype=torch.float16)
+    return contextlib.nullcontext()
 
 
 def align_words_whisperx(
@@ -354,22 +674,10 @@ def align_words_whisperx(
         except Exception:
             device = "cpu"
     
-    # Validate device
-    try:
-        import torch
-        if device == "cuda" and not torch.cuda.is_available():
-            logger.warning("CUDA requested but not available, falling back to CPU")
-            device = "cpu"
-    except Exception:
-        device = "cpu"
+    device = _resolve_device(device)
     
     try:
-        import whisperx
-        align_model, metadata = whisperx.load_align_model(
-            language_code=language_code,
-            device=device
-        )
-        logger.info(f"Loaded WhisperX alignment model for {language_code}")
+        align_model, metadata = _get_align_model(language_code, device)
     except Exception as e:
         raise ModelLoadError(
             f"Failed to load alignment model: {str(e)}",
@@ -378,40 +686,49 @@ def align_words_whisperx(
     
     try:
         import whisperx
-        aligned = whisperx.align(
-            segments,
-            align_model,
-            metadata,
-            audio,
-            device
-        )
+        with _align_precision(device):
+            aligned = whisperx.align(
+                segments,
+                align_model,
+                metadata,
+                audio,
+                device
+            )
     except Exception as e:
         raise TranscriptionError(
             f"Word alignment failed: {str(e)}",
             {"error": str(e)}
         )
     
-    aligned_words = []
+    words, starts, ends, confs = [], [], [], []
     for seg in aligned["segments"]:
         for w in seg.get("words", []):
             if w["start"] is not None and w["end"] is not None:
                 # Extract confidence/probability if available from WhisperX
                 confidence = w.get("probability", w.get("confidence", 0.5))
-                aligned_words.append({
-                    "word": w["word"].strip().lower(),
-                    "start": float(w["start"]),
-                    "end": float(w["end"]),
-                    "confidence": float(confidence) if confidence is not None else 0.5
-                })
-    
-    if not aligned_words:
+                words.append(w["word"].strip().lower())
+                starts.append(float(w["start"]))
+                ends.append(float(w["end"]))
+                confs.append(float(confidence) if confidence is not None else 0.5)
+    
+    if not words:
         raise NoSpeechDetectedError(
             "No words detected in aligned segments",
             {"segments_processed": len(aligned.get('segments', []))}
         )
     
-    df = pd.DataFrame(aligned_words)
-    return df.sort_values("start").reset_index(drop=True)
+    df = pd.DataFrame({
+        "word": words,
+        "start": np.asarray(starts, dtype=np.float64),
+        "end": np.asarray(ends, dtype=np.float64),
+        "confidence": np.asarray(confs, dtype=np.float64),
+    })
+    
+    # WhisperX emits segments and their words in time order, so the sort is
+    # normally skipped; an O(n) check guards against out-of-order output
+    if not df["start"].is_monotonic_increasing:
+        df = df.sort_values("start", kind="stable").reset_index(drop=True)
+    return df
 
 
 def extract_words_dataframe(result: Dict[str, Any]) -> pd.DataFrame:
@@ -427,49 +744,49 @@ def extract_words_dataframe(result: Dict[str, Any]) -> pd.DataFrame:
     Raises:
         NoSpeechDetectedError: If no words are found
     """
-    words = []
+    # Build one list per column; a single column-dict DataFrame call skips
+    # the per-row type inference of a list of dicts
+    word_col, start_col, end_col, conf_col = [], [], [], []
     for seg in result["segments"]:
         # Skip if words not available (e.g., when word_timestamps=False)
         if "words" not in seg:
             continue
         for w in seg["words"]:
-            words.append({
-                "word": w["word"].strip(),
-                "start": float(w["start"]),
-                "end": float(w["end"]),
-                "duration": float(w["end"] - w["start"]),
-                "confidence": float(w["probability"])
-            })
+            word_col.append(w["word"].strip())
+            start_col.append(float(w["start"]))
+            end_col.append(float(w["end"]))
+            conf_col.append(float(w["probability"]))
     
-    if not words:
+    if not word_col:
         # Create DataFrame from segments if word-level data unavailable
-        segments = result.get("segments", [])
-        if segments:
-            words_from_segments = []
-            for seg in segments:
-                text = seg.get("text", "").strip()
-                if text:
-                    # Split into words and create entries with segment timing
-                    seg_words = text.split()
-                    if seg_words:
-                        word_duration = (seg.get("end", 0) - seg.get("start", 0)) / len(seg_words)
-                        for i, word in enumerate(seg_words):
-                            words_from_segments.append({
-                                "word": word,
-                                "start": seg.get("start", 0) + i * word_duration,
-                                "end": seg.get("start", 0) + (i + 1) * word_duration,
-                                "duration": word_duration,
-                                "confidence": seg.get("confidence", 0.5)  # FIXED: Default to 0.5 (uncertain), not 1.0 (perfect)
-                            })
-            if words_from_segments:
-                return pd.DataFrame(words_from_segments)
+        for seg in result.get("segments", []):
+            text = seg.get("text", "").strip()
+            if text:
+                # Split into words and create entries with segment timing
+                seg_words = text.split()
+                seg_start = seg.get("start", 0)
+                word_duration = (seg.get("end", 0) - seg_start) / len(seg_words)
+                for i, word in enumerate(seg_words):
+                    word_col.append(word)
+                    start_col.append(seg_start + i * word_duration)
+                    end_col.append(seg_start + (i + 1) * word_duration)
+                    conf_col.append(seg.get("confidence", 0.5))  # FIXED: Default to 0.5 (uncertain), not 1.0 (perfect)
         
-        raise NoSpeechDetectedError(
-            "No words extracted from transcription",
-            {"segments": len(result.get('segments', []))}
-        )
+        if not word_col:
+            raise NoSpeechDetectedError(
+                "No words extracted from transcription",
+                {"segments": len(result.get('segments', []))}
+            )
     
-    return pd.DataFrame(words)
+    start = np.asarray(start_col, dtype=np.float64)
+    end = np.asarray(end_col, dtype=np.float64)
+    return pd.DataFrame({
+        "word": word_col,
+        "start": start,
+        "end": end,
+        "duration": end - start,
+        "confidence": conf_col,
+    })
 
 
 def extract_segments_dataframe(result: Dict[str, Any]) -> pd.DataFrame:
@@ -482,23 +799,31 @@ def extract_segments_dataframe(result: Dict[str, Any]) -> pd.DataFrame:
     Returns:
         DataFrame with segment timestamps and average confidence
     """
-    segments = []
-    for seg in result["segments"]:
-        # Handle missing word-level data (when word_timestamps=False)
-        if "words" in seg and len(seg["words"]) > 0:
-            avg_confidence = sum(
-                [float(w["probability"]) for w in seg["words"]]
-            ) / len(seg["words"])
-        else:
-            # FIXED: Use segment-level confidence if available, else default to 0.5 (uncertain), not 1.0 (perfect)
-            avg_confidence = float(seg.get("confidence", 0.5))
-        
-        segments.append({
-            "text": seg["text"].strip(),
-            "start": float(seg["start"]),
-            "end": float(seg["end"]),
-            "duration": float(seg["end"] - seg["start"]),
-            "avg_word_confidence": avg_confidence
-        })
-    
-    return pd.DataFrame(segments)
+    segs = result["segments"]
+    
+    # Flatten every word probability once and average per segment from a
+    # prefix sum, instead of a Python sum()/len() per segment
+    lens = np.fromiter((len(seg.get("words") or ()) for seg in segs), dtype=np.int64, count=len(segs))
+    probs = np.fromiter(
+        (float(w["probability"]) for seg in segs for w in seg.get("words") or ()),
+        dtype=np.float64,
+        count=int(lens.sum())
+    )
+    csum = np.concatenate(([0.0], np.cumsum(probs)))
+    ends_idx = np.cumsum(lens)
+    sums = csum[ends_idx] - csum[ends_idx - lens]
+    
+    # FIXED: Use segment-level confidence if available, else default to 0.5 (uncertain), not 1.0 (perfect)
+    fallback = np.fromiter((float(seg.get("confidence", 0.5)) for seg in segs), dtype=np.float64, count=len(segs))
+    avg_confidence = np.where(lens > 0, sums / np.maximum(lens, 1), fallback)
+    
+    start = np.fromiter((float(seg["start"]) for seg in segs), dtype=np.float64, count=len(segs))
+    end = np.fromiter((float(seg["end"]) for seg in segs), dtype=np.float64, count=len(segs))
+    
+    return pd.DataFrame({
+        "text": [seg["text"].strip() for seg in segs],
+        "start": start,
+        "end": end,
+        "duration": end - start,
+        "avg_word_confidence": avg_confidence,
+    })
@@ -1,24 +1,53 @@
 """Key manager for API key validation and RapidAPI signature verification."""
+import base64
 import hmac
 import hashlib
 import secrets
+import time
+from types import MappingProxyType
 from typing import Optional, Dict, Tuple
 from src.models.auth import InvalidAPIKeyError, AuthContext
+from src.utils.logging_config import logger
 import os
 
 
+# hmac.digest with a string digest name and hashlib.sha256 both go through
+# OpenSSL (SHA-NI on supporting CPUs) unless Python was built without it
+if hashlib.sha256.__name__ == "openssl_sha256":
+    logger.debug("SHA-256 backend: OpenSSL")
+else:
+    logger.warning(
+        "hashlib.sha256 is the builtin implementation, not OpenSSL; "
+        "signature verification will not use hardware SHA acceleration"
+    )
+
+
+# Successful validations only: {api_key: (expires_at, (key_hash, owner_type, owner_id))}
+# Invalid keys are never cached, so random attacker keys can't grow it.
+_AUTH_CACHE: Dict[str, Tuple[float, Tuple[str, str, Optional[str]]]] = {}
+_AUTH_CACHE_TTL_SEC = 60.0
+_AUTH_CACHE_MAX = 1024
+
+# RAPIDAPI_SECRET read and encoded once at import (empty when unset)
+_RAPIDAPI_SECRET = (os.environ.get("RAPIDAPI_SECRET") or "").encode()
+
+
+# Hardcoded valid API keys for development
+# Format: {key_hash: {"name": str, "owner_type": str}}
+# Generate new keys with: KeyManager.generate_key("your-name")
+_VALID_KEYS_BACKING = {
+    "5cc0f4d6ecfb565223c8e714a027758f0774dbb7fd21b9be12d152fc0265c6e9": {
+        "name": "my-dev-key",
+        "owner_type": "direct"
+    },
+}
+
+
 class KeyManager:
     """Manages API key validation and RapidAPI signature verification."""
     
-    # Hardcoded valid API keys for development
-    # Format: {key_hash: {"name": str, "owner_type": str}}
-    # Generate new keys with: KeyManager.create_test_key("your-name")
-    VALID_KEYS = {
-        "5cc0f4d6ecfb565223c8e714a027758f0774dbb7fd21b9be12d152fc0265c6e9": {
-            "name": "my-dev-key",
-            "owner_type": "direct"
-        },
-    }
+    # Hardcoded valid API keys (read-only view of _VALID_KEYS_BACKING above)
+    VALID_KEYS = MappingProxyType(_VALID_KEYS_BACKING)
     
     # RapidAPI keys - NO LONGER USED
     # RapidAPI Gateway validates subscriptions before forwarding requests.
@@ -29,6 +58,15 @@ class KeyManager:
     # Prefix for generated keys
     KEY_PREFIX = "sk_"
     
+    # Accepted key length window; generated keys are KEY_PREFIX + 24 chars.
+    # Anything outside is rejected before hashing attacker-sized input.
+    MIN_KEY_LENGTH = 16
+    MAX_KEY_LENGTH = 64
+    
+    # Plaintext index for keys supplied via API_KEYS, built once on first use
+    # Format: {api_key: (key_hash, key_info)}
+    _KEY_INDEX: Optional[Dict[str, Tuple[str, Dict]]] = None
+    
     @classmethod
     def generate_key(cls, name: str, owner_type: str = "direct") -> Tuple[str, str]:
         """
@@ -41,18 +79,21 @@ class KeyManager:
         Returns:
             Tuple of (key, key_hash)
             
-        Note: For production use, add the key_hash to VALID_KEYS dict above
+        Note: For production use, add the key_hash to _VALID_KEYS_BACKING above
         """
-        # Generate short alphanumeric key like "sk_AbCdEfGhIjKlMnOpQrStUvWxYz"
-        token = secrets.token_urlsafe(24).replace("-", "").replace("_", "")[:24]
+        # Generate short alphanumeric key like "sk_ABCDEFGHIJ234567ABCDEFGH":
+        # 15 random bytes base32-encode to exactly 24 chars (120 bits, no padding)
+        token = base64.b32encode(secrets.token_bytes(15)).decode("ascii")
         key = f"{cls.KEY_PREFIX}{token}"
         key_hash = cls._hash_key(key)
         
-        print(f"\n[OK] Generated key: {key}")
-        print(f"[OK] Key hash: {key_hash}")
-        print(f"\n[INFO] To use this key, add to VALID_KEYS in key_manager.py:")
-        print(f'\n    "{key_hash}": {{"name": "{name}", "owner_type": "{owner_type}"}},')
-        print()
+        # Never log the plaintext key: log handlers may persist it (file
+        # handler, aggregators); callers print it themselves
+        logger.info("Generated key for %s (hash: %s)", name, key_hash)
+        logger.info(
+            'To use this key, add to _VALID_KEYS_BACKING in key_manager.py: "%s": {"name": "%s", "owner_type": "%s"},',
+            key_hash, name, owner_type
+        )
         
         return key, key_hash
     
@@ -73,29 +114,77 @@ class KeyManager:
         if not api_key:
             raise InvalidAPIKeyError("API key is required")
         
-        # Check direct access keys (hashed)
-        key_hash = cls._hash_key(api_key)
-        if key_hash in cls.VALID_KEYS:
-            key_info = cls.VALID_KEYS[key_hash]
-            return AuthContext(
-                api_key=api_key,
-                key_hash=key_hash,
-                owner_type=key_info.get("owner_type", "direct"),
-                owner_id=key_info.get("name")
-            )
+        if not cls.MIN_KEY_LENGTH <= len(api_key) <= cls.MAX_KEY_LENGTH:
+            raise InvalidAPIKeyError("Invalid API key")
+        
+        # Recently validated key: skip the SHA-256 and key lookups. A fresh
+        # AuthContext is built per call since callers mutate it.
+        now = time.monotonic()
+        cached = _AUTH_CACHE.get(api_key)
+        if cached is not None:
+            expires_at, (key_hash, owner_type, owner_id) = cached
+            if now < expires_at:
+                return AuthContext(
+                    api_key=api_key,
+                    key_hash=key_hash,
+                    owner_type=owner_type,
+                    owner_id=owner_id
+                )
+            del _AUTH_CACHE[api_key]
         
+        # Known plaintext keys: one dict lookup, no hashing
+        indexed = cls._ensure_index().get(api_key)
+        if indexed is None:
+            # Check direct access keys (hashed); only keys not in API_KEYS pay for this
+            key_hash = cls._hash_key(api_key)
+            if key_hash in cls.VALID_KEYS:
+                indexed = (key_hash, cls.VALID_KEYS[key_hash])
+        
+        if indexed is not None:
+            key_hash, key_info = indexed
+            owner_type = key_info.get("owner_type", "direct")
         # Check RapidAPI keys (not hashed, compared directly)
-        if api_key in cls.RAPIDAPI_KEYS:
+        elif api_key in cls.RAPIDAPI_KEYS:
             key_info = cls.RAPIDAPI_KEYS[api_key]
-            return AuthContext(
-                api_key=api_key,
-                key_hash=api_key,  # Use key itself as hash for RapidAPI
-                owner_type=key_info.get("owner_type", "rapidapi"),
-                owner_id=key_info.get("name")
-            )
-        
-        # Key not found
-        raise InvalidAPIKeyError("Invalid API key")
+            key_hash = api_key  # Use key itself as hash for RapidAPI
+            owner_type = key_info.get("owner_type", "rapidapi")
+        else:
+            # Key not found
+            raise InvalidAPIKeyError("Invalid API key")
+        
+        owner_id = key_info.get("name")
+        if len(_AUTH_CACHE) >= _AUTH_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _AUTH_CACHE[next(iter(_AUTH_CACHE))]
+        _AUTH_CACHE[api_key] = (now + _AUTH_CACHE_TTL_SEC, (key_hash, owner_type, owner_id))
+        
+        return AuthContext(
+            api_key=api_key,
+            key_hash=key_hash,
+            owner_type=owner_type,
+            owner_id=owner_id
+        )
+    
+    @classmethod
+    def _ensure_index(cls) -> Dict[str, Tuple[str, Dict]]:
+        """
+        Build the plaintext key index on first use.
+        
+        Keys listed in the comma-separated API_KEYS environment variable are
+        hashed once here; those whose hash is in VALID_KEYS are indexed by
+        plaintext so validate_key can skip the per-request SHA-256.
+        """
+        if cls._KEY_INDEX is None:
+            index = {}
+            for key in os.getenv("API_KEYS", "").split(","):
+                key = key.strip()
+                if not key:
+                    continue
+                key_hash = cls._hash_key(key)
+                if key_hash in cls.VALID_KEYS:
+                    index[key] = (key_hash, cls.VALID_KEYS[key_hash])
+            cls._KEY_INDEX = index
+        return cls._KEY_INDEX
     
     @classmethod
     def verify_rapidapi_signature(
@@ -115,24 +204,25 @@ class KeyManager:
         Returns:
             True if signature is valid
         """
-        if not rapidapi_secret:
-            rapidapi_secret = os.getenv("RAPIDAPI_SECRET")
+        secret = rapidapi_secret.encode() if rapidapi_secret else _RAPIDAPI_SECRET
         
-        if not rapidapi_secret:
+        if not secret:
             # If no secret configured, skip verification but warn
             import logging
             logging.warning("RAPIDAPI_SECRET not configured, skipping signature verification")
             return True
         
-        # Reconstruct signature
-        expected_sig = hmac.new(
-            rapidapi_secret.encode(),
-            body,
-            hashlib.sha256
-        ).hexdigest()
+        try:
+            provided_sig = bytes.fromhex(signature_header)
+        except (TypeError, ValueError):
+            # Missing or malformed (non-hex) signature header
+            return False
+        
+        # Reconstruct signature with the one-shot C HMAC (no HMAC object)
+        expected_sig = hmac.digest(secret, body, "sha256")
         
         # Constant-time comparison
-        return hmac.compare_digest(signature_header, expected_sig)
+        return hmac.compare_digest(provided_sig, expected_sig)
     
     @classmethod
     def _hash_key(cls, key: str) -> str:
@@ -142,9 +232,11 @@ class KeyManager:
     @classmethod
     def get_keys_for_testing(cls) -> Dict[str, Dict]:
         """Get all hardcoded valid keys."""
-        return cls.VALID_KEYS.copy()
+        return dict(cls.VALID_KEYS)
     
     @classmethod
     def clear_keys(cls) -> None:
         """Clear all keys (for testing only)."""
-        cls.VALID_KEYS.clear()
+        _VALID_KEYS_BACKING.clear()
+        cls._KEY_INDEX = None
+        _AUTH_CACHE.clear()
@@ -1,10 +1,20 @@
 """FastAPI dependency injection for authentication."""
+import hmac
+import os
 from fastapi import Header, HTTPException, Request
 from typing import Optional
 from src.auth.key_manager import KeyManager
 from src.models.auth import AuthContext, InvalidAPIKeyError
 
 
+# Expected x-rapidapi-proxy-secret, encoded once. When unset, any non-empty
+# proxy secret is accepted (gateway presence check only).
+_EXPECTED_PROXY_SECRET = os.getenv("RAPIDAPI_PROXY_SECRET", "").encode("utf-8")
+
+# Largest request body accepted on authenticated routes (default 50MB)
+MAX_UPLOAD_BYTES = int(os.getenv("AUDIO_MAX_SIZE_BYTES", 50 * 1024 * 1024))
+
+
 async def get_direct_auth(
     x_api_key: str = Header(..., description="API key for direct access")
 ) -> AuthContext:
@@ -36,7 +46,10 @@ async def get_rapidapi_auth(request: Request) -> AuthContext:
     - x-rapidapi-user: Username of subscriber
     - x-mashape-user: Legacy format for username
     
-    We just check that these headers exist (meaning it came through RapidAPI).
+    We check that these headers exist (meaning it came through RapidAPI) and,
+    when RAPIDAPI_PROXY_SECRET is configured, that the proxy secret matches it.
+    The request body is never read or HMAC'd here, so large audio uploads
+    cost nothing to authenticate and are only materialized by the endpoint.
     
     Usage:
         @router.post("/analyze")
@@ -45,6 +58,12 @@ async def get_rapidapi_auth(request: Request) -> AuthContext:
     """
     from src.utils.logging_config import logger
     
+    # Reject oversized uploads on the declared length before any other work
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES:
+        logger.warning(f"[RapidAPI Auth] Request too large: {content_length} bytes")
+        raise HTTPException(status_code=413, detail="Request too large")
+    
     # Read headers (RapidAPI sends these for ANY valid subscriber)
     x_rapidapi_proxy_secret = request.headers.get("x-rapidapi-proxy-secret")
     x_rapidapi_user = request.headers.get("x-rapidapi-user") or request.headers.get("x-mashape-user")
@@ -57,6 +76,13 @@ async def get_rapidapi_auth(request: Request) -> AuthContext:
         logger.error("[RapidAPI Auth] FAILED: Not from RapidAPI Gateway (missing x-rapidapi-proxy-secret)")
         raise HTTPException(status_code=401, detail="Invalid RapidAPI request")
     
+    # Constant-time check so the response time doesn't leak the secret's prefix
+    if _EXPECTED_PROXY_SECRET and not hmac.compare_digest(
+        x_rapidapi_proxy_secret.encode("utf-8"), _EXPECTED_PROXY_SECRET
+    ):
+        logger.error("[RapidAPI Auth] FAILED: x-rapidapi-proxy-secret does not match")
+        raise HTTPException(status_code=401, detail="Invalid RapidAPI request")
+    
     if not x_rapidapi_user:
         logger.error("[RapidAPI Auth] FAILED: Missing RapidAPI user information")
         raise HTTPException(status_code=401, detail="Invalid RapidAPI user")
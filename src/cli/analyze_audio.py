@@ -13,6 +13,23 @@ import asyncio
 from pathlib import Path
 
 
+def _write_json(result: dict, path: str) -> None:
+    """Write the result as indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, "w") as f:
+            json.dump(result, f, indent=2)
+        return
+    
+    data = orjson.dumps(
+        result,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
@@ -35,8 +52,7 @@ def main():
     
     # Save to JSON if requested
     if output_json:
-        with open(output_json, "w") as f:
-            json.dump(result, f, indent=2)
+        _write_json(result, output_json)
         print(f"\n✓ Results saved to: {output_json}")
     
     return result
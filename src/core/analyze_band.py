@@ -1,27 +1,39 @@
 # analyze_band.py
-import sys
-from pathlib import Path
+import logging
 from src.core.analyzer_raw import analyze_speech
 from src.core.llm_processing import extract_llm_annotations, aggregate_llm_metrics
 from src.core.ielts_band_scorer import IELTSBandScorer
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 
-PROJECT_ROOT = Path.cwd().parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO-8601 with a 'Z' suffix (e.g. 2024-01-01T12:00:00.123456Z)."""
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
 
-def build_analysis(raw_analysis: dict) -> dict:
+
+def build_analysis(raw_analysis: dict, metrics_for_scoring: Optional[dict] = None) -> dict:
     """
     Build analysis report with band scoring.
     
     Now takes the raw_analysis dict directly and extracts metrics
     needed for the scorer.
+    
+    Args:
+        raw_analysis: Raw analysis dict from the analyzer
+        metrics_for_scoring: Metrics the caller already scored with; when
+            given, used as-is (not copied) instead of being rebuilt from
+            raw_analysis
     """
     from src.utils.logging_config import logger
     
     # ---- Extract basic metrics ----
-    total_words = raw_analysis["statistics"]["total_words_transcribed"]
-    content_words = raw_analysis["statistics"]["content_words"]
+    # Nested sections looked up once; the literal below is the cheapest way
+    # to build the fixed-shape report (CPython presizes dict displays)
+    statistics = raw_analysis["statistics"]
+    timestamps = raw_analysis["timestamps"]
+    total_words = statistics["total_words_transcribed"]
+    content_words = statistics["content_words"]
 
     # ---- Extract word confidence metrics ----
     # Use pre-calculated values from raw_analysis if available
@@ -31,28 +43,38 @@ def build_analysis(raw_analysis: dict) -> dict:
 
     # ---- Build metrics dict for scorer ----
     # Use the actual metrics from raw_analysis
-    metrics_for_scoring = {
-        # Fluency metrics
-        "wpm": raw_analysis.get("wpm", 0),
-        "long_pauses_per_min": raw_analysis.get("long_pauses_per_min", 0),
-        "pause_variability": raw_analysis.get("pause_variability", 0),
-        "repetition_ratio": raw_analysis.get("repetition_ratio", 0),
+    if metrics_for_scoring is None:
+        metrics_for_scoring = {
+            # Fluency metrics
+            "wpm": raw_analysis.get("wpm", 0),
+            "long_pauses_per_min": raw_analysis.get("long_pauses_per_min", 0),
+            "pause_variability": raw_analysis.get("pause_variability", 0),
+            "repetition_ratio": raw_analysis.get("repetition_ratio", 0),
         
-        # Pronunciation metrics
-        "mean_word_confidence": mean_word_confidence,
-        "low_confidence_ratio": low_confidence_ratio,
+            # Pronunciation metrics
+            "mean_word_confidence": mean_word_confidence,
+            "low_confidence_ratio": low_confidence_ratio,
         
-        # Lexical metrics
-        "vocab_richness": raw_analysis.get("vocab_richness", 0),
-        "lexical_density": raw_analysis.get("lexical_density", 0),
+            # Lexical metrics
+            "vocab_richness": raw_analysis.get("vocab_richness", 0),
+            "lexical_density": raw_analysis.get("lexical_density", 0),
         
-        # Grammar metrics
-        "mean_utterance_length": raw_analysis.get("mean_utterance_length", 0),
-        "speech_rate_variability": raw_analysis.get("speech_rate_variability", 0),
-    }
+            # Grammar metrics
+            "mean_utterance_length": raw_analysis.get("mean_utterance_length", 0),
+            "speech_rate_variability": raw_analysis.get("speech_rate_variability", 0),
+        }
     
-    # DEBUG: Log extracted metrics
-    logger.info(f"[METRICS_DEBUG] WPM={metrics_for_scoring.get('wpm')} | VocabRich={metrics_for_scoring.get('vocab_richness')} | LexDens={metrics_for_scoring.get('lexical_density')} | MeanUtterLen={metrics_for_scoring.get('mean_utterance_length')} | MeanConf={mean_word_confidence} | LowConfRatio={low_confidence_ratio}")
+    # DEBUG: Log extracted metrics (formatted only when INFO is emitted)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[METRICS_DEBUG] WPM=%s | VocabRich=%s | LexDens=%s | MeanUtterLen=%s | MeanConf=%s | LowConfRatio=%s",
+            metrics_for_scoring["wpm"],
+            metrics_for_scoring["vocab_richness"],
+            metrics_for_scoring["lexical_density"],
+            metrics_for_scoring["mean_utterance_length"],
+            mean_word_confidence,
+            low_confidence_ratio,
+        )
 
     return {
         "metadata": {
@@ -60,7 +82,7 @@ def build_analysis(raw_analysis: dict) -> dict:
             "speaking_time_sec": round(raw_analysis.get("speaking_time_sec", 0), 2),
             "total_words_transcribed": total_words,
             "content_word_count": content_words,
-            "analysis_timestamp": datetime.utcnow().isoformat() + "Z",
+            "analysis_timestamp": _utc_timestamp(),
         },
         "fluency_analysis": raw_analysis.get("fluency_analysis", {}),
         
@@ -73,7 +95,7 @@ def build_analysis(raw_analysis: dict) -> dict:
                 "low_confidence_ratio": round(low_confidence_ratio, 3),
             },
             "prosody": {
-                "monotone_detected": raw_analysis["statistics"].get("is_monotone", False),
+                "monotone_detected": statistics.get("is_monotone", False),
             },
         },
 
@@ -81,9 +103,9 @@ def build_analysis(raw_analysis: dict) -> dict:
         # RAW DATA (unchanged)
         # ==================================================
         "raw_data": {
-            "word_timestamps": raw_analysis["timestamps"]["words_timestamps_raw"],
+            "word_timestamps": timestamps["words_timestamps_raw"],
             "pause_events": raw_analysis.get("pause_events", []),
-            "filler_events": raw_analysis["timestamps"].get("filler_timestamps", []),
+            "filler_events": timestamps.get("filler_timestamps", []),
             "stutter_events": raw_analysis.get("stutter_events", []),
         },
         
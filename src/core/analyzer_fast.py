@@ -19,19 +19,87 @@ Not a wrapper around run_engine - actual implementation of optimization.
 
 import asyncio
 import json
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 import time
+import numpy as np
 import pandas as pd
 
-from src.core.audio_processing import transcribe_verbatim_fillers, extract_words_dataframe, extract_segments_dataframe, mark_filler_words, get_content_words
-from src.core.fluency_metrics import analyze_fluency
-from src.core.analyze_band import build_analysis
-from src.core.ielts_band_scorer import score_ielts_speaking
-from src.core.metrics import calculate_normalized_metrics
+from src.audio.processing import CORE_FILLERS, transcribe_verbatim_fillers, extract_words_dataframe, extract_segments_dataframe
+from src.audio.filler_detection import mark_filler_words, split_content_words
+from src.utils.config import CONTEXT_CONFIG
 from src.utils.logging_config import logger
 
+# Print the end-of-analysis banner to stdout; only the CLI entry point sets this
+VERBOSE = False
+
+# Worker processes for whole CPU analyses (FAST_ANALYZER_PROCESSES, 0 = run
+# in this process). Each worker loads its own Whisper model on first use, so
+# CUDA requests always run in-process rather than putting N models on one GPU.
+PROCESS_WORKERS = int(os.getenv("FAST_ANALYZER_PROCESSES", "0"))
+_PROCESS_POOL = None
+_IN_WORKER = False
+
+
+# Empty filler frame with the schema calculate_normalized_metrics expects,
+# built once (read-only by convention: no stage mutates df_fillers)
+_EMPTY_FILLERS_DF = pd.DataFrame({
+    'word': pd.Series(dtype=object),
+    'type': pd.Series(dtype=object),
+    'text': pd.Series(dtype=object),
+    'start': pd.Series(dtype='float64'),
+    'end': pd.Series(dtype='float64'),
+    'duration': pd.Series(dtype='float64'),
+})
+
+
+def fast_records(df: pd.DataFrame) -> list:
+    """
+    Same output as df.to_dict(orient="records"), built column-major.
+    
+    Each column goes through one C-level ndarray.tolist() (native Python
+    scalars), then rows are zipped, instead of pandas boxing row by row.
+    """
+    cols = df.columns.tolist()
+    arrays = [df[c].to_numpy().tolist() for c in cols]
+    return [dict(zip(cols, row)) for row in zip(*arrays)]
+
+
+def _init_analysis_worker() -> None:
+    """Mark a pool process so its analyses run inline rather than re-dispatching."""
+    global _IN_WORKER
+    _IN_WORKER = True
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Create the analysis process pool on first use."""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        # spawn, not fork: forking a process that already holds torch threads can deadlock
+        _PROCESS_POOL = ProcessPoolExecutor(
+            max_workers=PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_analysis_worker
+        )
+    return _PROCESS_POOL
+
+
+def shutdown_process_pool() -> None:
+    """Stop the analysis worker processes, if any were started (app shutdown hook)."""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown(wait=True, cancel_futures=True)
+        _PROCESS_POOL = None
+
+
+def _analyze_in_worker(audio_path: str, speech_context: str, device: str) -> Dict[str, Any]:
+    """Process-pool entry point: run the pipeline on the worker's own event loop."""
+    return asyncio.run(analyze_speech_fast(audio_path, speech_context, device))
+
 
 async def analyze_speech_fast(
     audio_path: str,
@@ -65,6 +133,15 @@ async def analyze_speech_fast(
         
     Runtime: ~30-40 seconds (vs 60+ seconds for full analysis)
     """
+    if PROCESS_WORKERS > 0 and device == "cpu" and not _IN_WORKER:
+        # Whole analysis in a worker process: pandas/NumPy stages of
+        # concurrent requests then run in parallel instead of sharing one GIL.
+        # CPU only: GPU requests share the one in-process model
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_process_pool(), _analyze_in_worker, str(audio_path), speech_context, device
+        )
+    
     start_time = time.time()
     logger.info(f"[FAST - Phase 1] Starting optimized analysis...")
     logger.info(f"  Audio: {audio_path}")
@@ -72,10 +149,17 @@ async def analyze_speech_fast(
     logger.info(f"  Optimization: SKIP WhisperX + Wav2Vec2 + LLM Annotations (40% speedup)")
     
     try:
+        # Scoring modules (and the LLM client they pull in) load on first
+        # analysis, not when the API imports this module
+        from src.core.fluency_metrics import analyze_fluency
+        from src.core.analyze_band import build_analysis
+        from src.core.ielts_band_scorer import score_ielts_speaking
+        from src.core.metrics import calculate_normalized_metrics
+        
         # =====================================================================
         # STAGE 1: WHISPER TRANSCRIPTION (KEPT)
         # =====================================================================
-        print("\n[1/4] Transcribing with Whisper (Phase 1 - no WhisperX alignment)...")
+        logger.debug("[1/4] Transcribing with Whisper (Phase 1 - no WhisperX alignment)...")
         stage1_start = time.time()
         
         verbatim_result = await asyncio.to_thread(
@@ -87,70 +171,108 @@ async def analyze_speech_fast(
         df_words = extract_words_dataframe(verbatim_result)
         df_segments = extract_segments_dataframe(verbatim_result)
         
+        # Confidence stats from one pass over the column, reused below
+        # (mean skips NaN like Series.mean; the ratio is over all words)
+        conf = df_words['confidence'].to_numpy(dtype=np.float64)
+        if conf.size:
+            mean_word_confidence = float(np.nanmean(conf))
+            low_confidence_ratio = float(np.count_nonzero(conf < 0.6) / conf.size)
+        else:
+            mean_word_confidence = 0
+            low_confidence_ratio = 0
+        
         if df_segments.empty:
             logger.warning("No speech detected in audio")
             return _empty_response()
         
+        # Last segment end, read once as a scalar and reused for every duration field
+        total_duration = float(df_segments['end'].iat[-1])
+        
         stage1_time = time.time() - stage1_start
-        print(f"  [OK] {stage1_time:.1f}s | {len(df_words)} words, {df_segments.iloc[-1]['end']:.1f}s duration")
+        logger.debug(f"  [OK] {stage1_time:.1f}s | {len(df_words)} words, {total_duration:.1f}s duration")
         
         # =====================================================================
         # STAGE 2: WHISPERX ALIGNMENT (SKIPPED IN PHASE 1)
         # =====================================================================
         logger.info("[SKIP] Stage 2: WhisperX Alignment (saves 5-10s)")
-        print("[SKIP] Stage 2: WhisperX alignment skipped (Phase 1)")
         # Note: Using Whisper confidence directly instead
         
         # =====================================================================
         # STAGE 3: WAV2VEC2 FILLER DETECTION (SKIPPED IN PHASE 1)
         # =====================================================================
         logger.info("[SKIP] Stage 3: Wav2Vec2 Filler Detection (saves 15-20s)")
-        print("[SKIP] Stage 3: Wav2Vec2 filler detection skipped (Phase 1)")
         
         # Mark fillers using basic Whisper-only detection
-        print("\n[2/4] Marking filler words (Whisper only, no Wav2Vec2)...")
+        logger.debug("[2/4] Marking filler words (Whisper only, no Wav2Vec2)...")
         stage3_start = time.time()
         
-        from src.core.audio_processing import CORE_FILLERS
         df_words = mark_filler_words(df_words, CORE_FILLERS)
-        filler_count = df_words['is_filler'].sum()
+        # Boolean mask materialized once; the count and the filler subset
+        # below both read it instead of rescanning the column
+        is_filler = df_words['is_filler'].to_numpy(dtype=bool)
+        filler_count = int(is_filler.sum())
         
         stage3_time = time.time() - stage3_start
-        print(f"  [OK] {stage3_time:.1f}s | {int(filler_count)} filler words marked")
+        logger.debug(f"  [OK] {stage3_time:.1f}s | {int(filler_count)} filler words marked")
         
         # =====================================================================
         # STAGE 4: LLM BAND SCORING (KEPT - CRITICAL)
         # =====================================================================
-        print("\n[3/4] Analyzing fluency and scoring IELTS bands...")
+        logger.debug("[3/4] Analyzing fluency and scoring IELTS bands...")
         stage4_start = time.time()
         
-        df_words_content = get_content_words(df_words)
-        transcript = " ".join(df_words_content['word'].astype(str).tolist())
-        total_duration = float(df_segments.iloc[-1]['end']) if not df_segments.empty else 0
+        df_words_content, content_mask = split_content_words(df_words)
+        content_words = df_words_content['word']
+        if not pd.api.types.is_string_dtype(content_words):
+            content_words = content_words.astype(str)
+        transcript = " ".join(content_words.tolist())
         
         # Create filler dataframe for Phase 1 (Wav2Vec2 skipped)
         # Extract Whisper-detected fillers from is_filler column
-        df_fillers = df_words[df_words['is_filler']].copy() if 'is_filler' in df_words.columns else pd.DataFrame()
-        
-        if not df_fillers.empty:
-            # Add required columns for calculate_normalized_metrics
-            df_fillers['type'] = 'filler'
-            df_fillers['text'] = df_fillers['word'].str.lower()
-            df_fillers = df_fillers[['word', 'type', 'text', 'start', 'end', 'duration']]
+        if filler_count:
+            # Build the filler subset with its required columns in one go,
+            # straight from the column arrays at the filler positions
+            filler_idx = np.flatnonzero(is_filler)
+            words = df_words['word'].iloc[filler_idx]
+            df_fillers = pd.DataFrame({
+                'word': words.to_numpy(),
+                'type': 'filler',
+                'text': words.str.lower().to_numpy(),
+                'start': df_words['start'].to_numpy()[filler_idx],
+                'end': df_words['end'].to_numpy()[filler_idx],
+                'duration': df_words['duration'].to_numpy()[filler_idx],
+            })
         else:
-            # Create empty dataframe with required columns
-            df_fillers = pd.DataFrame(columns=['word', 'type', 'text', 'start', 'end', 'duration'])
-        
-        # Analyze fluency
-        fluency_analysis = analyze_fluency(
-            df_words_full=df_words,
-            df_words_content=df_words_content,
-            df_segments=df_segments,
-            df_fillers=df_fillers,
-            total_duration=total_duration,
-            speech_context=speech_context
+            # Shared empty frame; the metric functions only read it
+            df_fillers = _EMPTY_FILLERS_DF
+        
+        # Fluency analysis and normalized metrics only read the frames, so run
+        # them in worker threads together and keep the event loop free
+        fluency_analysis, normalized_metrics = await asyncio.gather(
+            asyncio.to_thread(
+                analyze_fluency,
+                df_words_full=df_words,
+                df_words_content=df_words_content,
+                df_segments=df_segments,
+                df_fillers=df_fillers,
+                total_duration=total_duration,
+                speech_context=speech_context
+            ),
+            asyncio.to_thread(
+                calculate_normalized_metrics,
+                df_words_asr=df_words,
+                df_words_content=df_words_content,
+                df_segments=df_segments,
+                df_fillers=df_fillers,
+                total_duration=total_duration
+            ),
         )
         
+        # The cleaned records are the raw records at the content positions
+        # (the same dict objects, shared rather than serialized a second time)
+        word_records = fast_records(df_words)
+        content_records = [word_records[i] for i in np.flatnonzero(content_mask).tolist()]
+        
         # Build analysis structure for band scoring
         raw_analysis = {
             "raw_transcript": transcript,
@@ -162,27 +284,18 @@ async def analyze_speech_fast(
                 "is_monotone": False
             },
             "timestamps": {
-                "words_timestamps_raw": df_words.to_dict(orient="records"),
-                "words_timestamps_cleaned": df_words_content.to_dict(orient="records"),
-                "segment_timestamps": df_segments.to_dict(orient="records"),
+                "words_timestamps_raw": word_records,
+                "words_timestamps_cleaned": content_records,
+                "segment_timestamps": fast_records(df_segments),
             },
             "fluency_analysis": fluency_analysis,
         }
         
-        # Calculate normalized metrics for band scoring
-        normalized_metrics = calculate_normalized_metrics(
-            df_words_asr=df_words,
-            df_words_content=df_words_content,
-            df_segments=df_segments,
-            df_fillers=df_fillers,
-            total_duration=total_duration
-        )
-        
         # Add metrics to raw_analysis for build_analysis and band scoring
         raw_analysis.update(normalized_metrics)
         raw_analysis["audio_duration_sec"] = total_duration
-        raw_analysis["mean_word_confidence"] = float(df_words['confidence'].mean()) if len(df_words) > 0 else 0
-        raw_analysis["low_confidence_ratio"] = float((df_words['confidence'] < 0.6).sum() / len(df_words)) if len(df_words) > 0 else 0
+        raw_analysis["mean_word_confidence"] = mean_word_confidence
+        raw_analysis["low_confidence_ratio"] = low_confidence_ratio
         
         # Score IELTS bands using proper metrics
         band_scores = score_ielts_speaking(
@@ -192,26 +305,26 @@ async def analyze_speech_fast(
         )
         
         stage4_time = time.time() - stage4_start
-        print(f"  [OK] {stage4_time:.1f}s | Band score: {band_scores.get('overall_band', 'N/A')}")
+        logger.debug(f"  [OK] {stage4_time:.1f}s | Band score: {band_scores.get('overall_band', 'N/A')}")
         
         # =====================================================================
         # STAGE 5: LLM ANNOTATIONS (SKIPPED IN PHASE 1)
         # =====================================================================
         logger.info("[SKIP] Stage 5: LLM Annotations (saves 15-20s)")
-        print("\n[SKIP] Stage 4: LLM annotations skipped (Phase 1)")
         
         # =====================================================================
         # STAGE 6: POST-PROCESSING & AGGREGATION (KEPT)
         # =====================================================================
-        print("\n[4/4] Finalizing analysis...")
+        logger.debug("[4/4] Finalizing analysis...")
         stage6_start = time.time()
         
-        analysis = build_analysis(raw_analysis)
+        # Reuse the metrics the bands were scored with instead of rebuilding them
+        analysis = build_analysis(raw_analysis, metrics_for_scoring=normalized_metrics)
         
         # Build final response in same format as full analysis
         result = {
             "metadata": {
-                "audio_duration_sec": float(df_segments.iloc[-1]['end']) if not df_segments.empty else 0,
+                "audio_duration_sec": total_duration,
                 "optimization_phase": 1,
                 "optimization_description": "Phase 1 Aggressive: Skip WhisperX + Wav2Vec2 + LLM Annotations",
                 "optimization_note": "Band scores and metrics preserved; filler detection and feedback skipped for 40% speedup",
@@ -221,8 +334,8 @@ async def analyze_speech_fast(
             "band_scores": band_scores,
             "statistics": raw_analysis.get("statistics", {}),
             "speech_quality": {
-                "mean_word_confidence": float(df_words['confidence'].mean()) if len(df_words) > 0 else 0,
-                "low_confidence_ratio": float((df_words['confidence'] < 0.6).sum() / len(df_words)) if len(df_words) > 0 else 0,
+                "mean_word_confidence": mean_word_confidence,
+                "low_confidence_ratio": low_confidence_ratio,
                 "is_monotone": False,
             },
             "fluency_analysis": analysis.get("fluency_analysis", {}),
@@ -236,14 +349,19 @@ async def analyze_speech_fast(
         logger.info(f"  Total time: {total_time:.1f}s (40% speedup achieved)")
         logger.info(f"  Band score: {band_scores.get('overall_band', 'N/A')}")
         
-        print(f"\n{'='*70}")
-        print(f"[FAST - Phase 1] Analysis Complete")
-        print(f"{'='*70}")
-        print(f"  Total Time: {total_time:.1f}s")
-        print(f"  Band Score: {band_scores.get('overall_band', 'N/A')}")
-        print(f"  Optimization: Phase 1 (40% speedup)")
-        print(f"  Format: Identical to /analyze (for API compatibility)")
-        print(f"{'='*70}\n")
+        if VERBOSE:
+            # CLI banner, written in one call instead of one print per line
+            sys.stdout.write("\n".join([
+                f"\n{'='*70}",
+                f"[FAST - Phase 1] Analysis Complete",
+                f"{'='*70}",
+                f"  Total Time: {total_time:.1f}s",
+                f"  Band Score: {band_scores.get('overall_band', 'N/A')}",
+                f"  Optimization: Phase 1 (40% speedup)",
+                f"  Format: Identical to /analyze (for API compatibility)",
+                f"{'='*70}\n",
+            ]) + "\n")
+            sys.stdout.flush()
         
         return result
     
@@ -276,40 +394,87 @@ def _empty_response() -> Dict:
     }
 
 
+async def analyze_batch(
+    audio_paths: List[str],
+    speech_context: str = "conversational",
+    device: str = "cpu",
+    max_concurrency: int = 4
+) -> List[Dict[str, Any]]:
+    """
+    Run analyze_speech_fast over several files concurrently.
+    
+    All files share the process-wide cached Whisper model; the semaphore
+    bounds how many analyses (and their audio/DataFrames) are in flight.
+    
+    Args:
+        audio_paths: Paths to audio files
+        speech_context: Speech context applied to every file
+        device: Device to use (cpu or cuda)
+        max_concurrency: Maximum number of files analyzed at once
+        
+    Returns:
+        One result dict per path, in input order
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+    
+    async def _run_one(path: str) -> Dict[str, Any]:
+        async with sem:
+            return await analyze_speech_fast(path, speech_context, device)
+    
+    return await asyncio.gather(*[_run_one(p) for p in audio_paths])
+
+
+def _print_summary(result: Dict[str, Any]) -> None:
+    """Print the CLI summary for one analysis result."""
+    if result and result.get('band_scores'):
+        print(f"✓ Band Score: {result['band_scores'].get('overall_band', 'N/A')}")
+        print(f"✓ Optimization: {result.get('metadata', {}).get('optimization_phase', 'unknown')}")
+        print(f"✓ Output Format: Identical to /analyze")
+        if result.get('transcript'):
+            transcript = result['transcript'][:100]
+            print(f"✓ Transcript: {transcript}..." if len(result.get('transcript', '')) > 100 else f"✓ Transcript: {result.get('transcript', '')}")
+    else:
+        print(f"✗ Error: {result.get('error', 'Unknown error')}")
+
+
 async def main():
-    """CLI entry point for fast analysis."""
+    """CLI entry point for fast analysis (one or more audio files, optional trailing context name)."""
     if len(sys.argv) < 2:
         print(__doc__)
         sys.exit(1)
     
-    audio_path = sys.argv[1]
-    speech_context = sys.argv[2] if len(sys.argv) > 2 else "conversational"
+    args = sys.argv[1:]
+    # Only a known context name is taken as the speech context; anything else
+    # is an audio path, so a mistyped file name is reported, not reinterpreted
+    speech_context = args.pop() if len(args) > 1 and args[-1] in CONTEXT_CONFIG else "conversational"
+    audio_paths = args
     
-    # Validate file exists
-    if not Path(audio_path).exists():
-        print(f"Error: Audio file not found: {audio_path}")
+    # Validate files exist
+    missing = [audio_path for audio_path in audio_paths if not Path(audio_path).exists()]
+    if missing:
+        for audio_path in missing:
+            print(f"Error: Audio file not found: {audio_path}")
         sys.exit(1)
     
-    result = await analyze_speech_fast(audio_path, speech_context)
+    if len(audio_paths) == 1:
+        results = [await analyze_speech_fast(audio_paths[0], speech_context)]
+    else:
+        results = await analyze_batch(audio_paths, speech_context)
     
     # Print summary
     print("\n" + "=" * 70)
     print("FAST ANALYSIS COMPLETE (Phase 1 Optimization)")
     print("=" * 70)
     
-    if result and result.get('band_scores'):
-        print(f"✓ Band Score: {result['band_scores'].get('overall_band', 'N/A')}")
-        print(f"✓ Optimization: {result.get('metadata', {}).get('optimization_phase', 'unknown')}")
-        print(f"✓ Output Format: Identical to /analyze")
-        if result.get('transcript'):
-            transcript = result['transcript'][:100]
-            print(f"✓ Transcript: {transcript}..." if len(result.get('transcript', '')) > 100 else f"✓ Transcript: {result.get('transcript', '')}")
-    else:
-        print(f"✗ Error: {result.get('error', 'Unknown error')}")
+    for audio_path, result in zip(audio_paths, results):
+        if len(audio_paths) > 1:
+            print(f"\n{audio_path}")
+        _print_summary(result)
     
     print("=" * 70 + "\n")
-    return result
+    return results[0] if len(results) == 1 else results
 
 
 if __name__ == "__main__":
+    VERBOSE = True
     asyncio.run(main())
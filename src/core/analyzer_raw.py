@@ -58,52 +58,82 @@ def combine_words_and_fillers(
     
     Only non-empty, valid tokens are included.
     """
-    tokens = []
+    columns = ["start", "end", "text", "source", "type"]
+    parts = []
 
-    # Add Whisper words
+    # Add Whisper words (non-empty text with a start time)
     if not df_words_raw.empty:
-        for _, row in df_words_raw.iterrows():
-            word = str(row.get("word", "")).strip()
-            if word and not pd.isna(row.get("start")):
-                tokens.append({
-                    "start": float(row["start"]),
-                    "end": float(row["end"]),
-                    "text": word,
-                    "source": "whisper",
-                    "type": "word"
-                })
+        text = df_words_raw["word"].astype(str).str.strip()
+        keep = (text != "") & df_words_raw["start"].notna()
+        parts.append(pd.DataFrame({
+            "start": df_words_raw["start"][keep].astype(float),
+            "end": df_words_raw["end"][keep].astype(float),
+            "text": text[keep],
+            "source": "whisper",
+            "type": "word",
+        }))
 
     # Add Wav2Vec2 fillers/stutters (only if they have non-empty 'text')
-    if not df_final_fillers.empty:
-        for _, row in df_final_fillers.iterrows():
-            text = row.get("text", "")
-            if pd.isna(text):
-                text = ""
-            else:
-                text = str(text).strip()
-            
-            if text and "start" in row and "end" in row:
-                tokens.append({
-                    "start": float(row["start"]),
-                    "end": float(row["end"]),
-                    "text": text,
-                    "source": "wav2vec",
-                    "type": row.get("type", "filler")  # 'filler' or 'stutter'
-                })
+    if not df_final_fillers.empty and {"start", "end"}.issubset(df_final_fillers.columns):
+        if "text" in df_final_fillers.columns:
+            text = df_final_fillers["text"].fillna("").astype(str).str.strip()
+        else:
+            text = pd.Series("", index=df_final_fillers.index)
+        keep = text != ""
+        parts.append(pd.DataFrame({
+            "start": df_final_fillers["start"][keep].astype(float),
+            "end": df_final_fillers["end"][keep].astype(float),
+            "text": text[keep],
+            "source": "wav2vec",
+            # 'filler' or 'stutter'
+            "type": df_final_fillers["type"][keep] if "type" in df_final_fillers.columns else "filler",
+        }))
 
-    if not tokens:
-        return pd.DataFrame(columns=["start", "end", "text", "source", "type"])
+    parts = [part for part in parts if not part.empty]
+    if not parts:
+        return pd.DataFrame(columns=columns)
 
-    # Sort by start time
-    tokens_sorted = sorted(tokens, key=lambda x: x["start"])
-    
-    # Convert to DataFrame
-    df_combined = pd.DataFrame(tokens_sorted)
+    # Stable sort by start time: on ties Whisper words stay ahead of fillers
+    df_combined = pd.concat(parts, ignore_index=True)[columns]
+    return df_combined.sort_values("start", kind="mergesort").reset_index(drop=True)
+
+def backfill_confidence(
+    df_words: pd.DataFrame,
+    df_aligned_words: pd.DataFrame,
+    tolerance: float = 0.01,
+) -> int:
+    """
+    Copy WhisperX confidence onto Whisper words in place, matched by start time.
     
-    # Optional: reset index
-    df_combined.reset_index(drop=True, inplace=True)
+    Each word takes the confidence of the aligned word whose start is nearest
+    its own, within `tolerance` seconds. Words with a NaN start or no aligned
+    word in range keep their confidence.
     
-    return df_combined
+    Returns:
+        Number of words whose confidence was updated
+    """
+    if df_aligned_words.empty or 'confidence' not in df_aligned_words.columns:
+        return 0
+
+    # One sorted as-of join instead of a filter over all aligned words per word;
+    # 'index' carries each word's position back for the write
+    left = df_words[['start']].astype(float).reset_index(drop=True)
+    left = left[left['start'].notna()].sort_values('start', kind='mergesort').reset_index()
+    right = (
+        df_aligned_words[['start', 'confidence']]
+        .dropna(subset=['start'])
+        .astype({'start': float})
+        .sort_values('start', kind='mergesort')
+        .assign(_matched=True)
+    )
+    merged = pd.merge_asof(left, right, on='start', tolerance=tolerance, direction='nearest')
+    hit = merged['_matched'].notna().to_numpy()
+    if hit.any():
+        df_words.iloc[
+            merged['index'].to_numpy()[hit],
+            df_words.columns.get_loc('confidence')
+        ] = merged['confidence'].to_numpy()[hit]
+    return int(hit.sum())
 
 async def analyze_speech(
     audio_path: str,
@@ -118,9 +148,12 @@ async def analyze_speech(
     
     # Step 1: Verbatim transcription (source of truth)
     print("\n[1/5] Transcribing with Whisper (verbatim)...")
-    transcribe_verbatim_fillers_task = asyncio.to_thread(transcribe_verbatim_fillers, str(audio_path), device=device)
+    # Decode the 16kHz array once and hand it to Whisper, Wav2Vec2 and
+    # WhisperX, so none of them re-reads and resamples the same file
+    audio, _ = await asyncio.to_thread(load_audio, audio_path)
+    transcribe_verbatim_fillers_task = asyncio.to_thread(transcribe_verbatim_fillers, audio, device=device)
     is_monotone_speech_task = asyncio.to_thread(is_monotone_speech, audio_path)
-    detect_phonemes_wav2vec_task = asyncio.to_thread(detect_phonemes_wav2vec, audio_path)
+    detect_phonemes_wav2vec_task = asyncio.to_thread(detect_phonemes_wav2vec, audio, device=device)
 
     verbatim_result, is_monotone, df_wav2vec = await asyncio.gather(
         transcribe_verbatim_fillers_task,
@@ -171,28 +204,23 @@ async def analyze_speech(
     
     # Step 3: Align words with WhisperX
     print("\n[3/5] Aligning words with WhisperX...")
-    audio, _ = load_audio(audio_path)
-    df_aligned_words = align_words_whisperx(verbatim_result["segments"], audio, device=device)
+    df_aligned_words = await asyncio.to_thread(
+        align_words_whisperx, verbatim_result["segments"], audio, device=device
+    )
     print(f"  Aligned: {len(df_aligned_words)} words")
     
     # Merge WhisperX confidence back into Whisper words
-    # Match by word position/timing and update confidence from aligned data
     if not df_aligned_words.empty and 'confidence' in df_aligned_words.columns:
-        # Merge on approximate timing (within 10ms tolerance)
-        for idx, row in df_words_whisper_raw.iterrows():
-            # Find matching aligned word (by timing proximity)
-            matching = df_aligned_words[
-                (df_aligned_words['start'] >= row['start'] - 0.01) &
-                (df_aligned_words['start'] <= row['start'] + 0.01)
-            ]
-            if not matching.empty:
-                # Use the first match (should be unique)
-                df_words_whisper_raw.at[idx, 'confidence'] = matching.iloc[0]['confidence']
+        backfill_confidence(df_words_whisper_raw, df_aligned_words)
         print(f"  Updated confidence for {(df_words_whisper_raw['confidence'] > 0.5).sum()} words from WhisperX")
     
     # Step 4: Detect fillers with Wav2Vec2
     print("\n[4/5] Detecting subtle fillers with Wav2Vec2...")
-    df_wav2vec_fillers = detect_fillers_wav2vec(audio_path, df_aligned_words)
+    # Reuse the phoneme events computed alongside Whisper in step 1 and keep
+    # the blocking work off the event loop so concurrent requests overlap
+    df_wav2vec_fillers = await asyncio.to_thread(
+        detect_fillers_wav2vec, audio_path, df_aligned_words, df_wav2vec
+    )
     
     # Extract Whisper-detected fillers (already marked in df_words)
     df_whisper_fillers = df_words_whisper_raw[df_words_whisper_raw['is_filler']].copy()
@@ -8,6 +8,7 @@ Handles:
 """
 
 import asyncio
+import os
 import tempfile
 import json
 from pathlib import Path
@@ -82,7 +83,7 @@ async def run_engine(
         # CREATE TEMPORARY FILE
         # =============================================
         # Use wav extension for proper format handling
-        file_ext = Path(filename).suffix if Path(filename).suffix else ".wav"
+        file_ext = os.path.splitext(filename)[1] or ".wav"
         
         temp_file = tempfile.NamedTemporaryFile(
             suffix=file_ext,
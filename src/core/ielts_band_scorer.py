@@ -9,7 +9,11 @@ Combines:
 Confidence: ~85% (up from 65% with metrics-only)
 """
 
-from typing import Dict, Optional, List, Any
+import copy
+import hashlib
+import threading
+import time
+from typing import Dict, Optional, List, Any, Tuple
 from .llm_processing import extract_llm_annotations, aggregate_llm_metrics
 
 
@@ -1146,6 +1150,53 @@ class IELTSBandScorer:
 # PUBLIC ENTRY POINT (WITH OPTIONAL LLM)
 # ===============================================
 
+# Metrics-only results: {(sorted metric items, transcript sha256): (expires_at, result)}.
+# Without LLM input the scorer is deterministic, so re-runs of the same audio
+# (retries, repeated practice uploads) within the TTL reuse the result. Keyed
+# on a digest so raw transcripts aren't held in memory.
+_SCORE_CACHE: Dict[tuple, Tuple[float, Dict]] = {}
+_SCORE_CACHE_TTL_SEC = 300.0
+_SCORE_CACHE_MAX = 256
+_SCORE_CACHE_LOCK = threading.Lock()
+
+
+def _score_cache_key(metrics: Dict, transcript: str) -> Optional[tuple]:
+    """Cache key for a metrics-only scoring call, or None if metrics aren't hashable."""
+    try:
+        key = (
+            tuple(sorted(metrics.items())),
+            hashlib.sha256((transcript or "").encode()).hexdigest(),
+        )
+        hash(key)
+    except TypeError:
+        # Unhashable metric values (e.g. lists): score without the cache
+        return None
+    return key
+
+
+def _score_cache_get(key: tuple) -> Optional[Dict]:
+    """Copy of a live cached result, or None."""
+    with _SCORE_CACHE_LOCK:
+        entry = _SCORE_CACHE.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del _SCORE_CACHE[key]
+            return None
+    return copy.deepcopy(result)
+
+
+def _score_cache_put(key: tuple, result: Dict) -> None:
+    """Store a private copy of result, evicting the oldest entry when full."""
+    entry = (time.monotonic() + _SCORE_CACHE_TTL_SEC, copy.deepcopy(result))
+    with _SCORE_CACHE_LOCK:
+        if key not in _SCORE_CACHE and len(_SCORE_CACHE) >= _SCORE_CACHE_MAX:
+            # Dicts keep insertion order, so the first key is the oldest
+            del _SCORE_CACHE[next(iter(_SCORE_CACHE))]
+        _SCORE_CACHE[key] = entry
+
+
 def score_ielts_speaking(
     metrics: Dict, transcript: str = "", use_llm: bool = False
 ) -> Dict:
@@ -1166,22 +1217,33 @@ def score_ielts_speaking(
     from src.utils.logging_config import logger
     from src.utils.exceptions import LLMProcessingError
     
-    scorer = IELTSBandScorer()
-    llm_metrics = None
+    result = None
+    cache_key = None
+    if not (use_llm and transcript):
+        # No LLM branch: deterministic, so repeats are served from the cache
+        cache_key = _score_cache_key(metrics, transcript)
+        if cache_key is not None:
+            result = _score_cache_get(cache_key)
+    
+    if result is None:
+        scorer = IELTSBandScorer()
+        llm_metrics = None
 
-    if use_llm and transcript:
-        try:
-            from .llm_processing import extract_llm_annotations, aggregate_llm_metrics
-            
-            llm_annotations = extract_llm_annotations(transcript)
-            llm_metrics = aggregate_llm_metrics(llm_annotations)
-            logger.info("LLM scoring successful")
-        except LLMProcessingError as e:
-            logger.warning(f"LLM scoring failed, falling back to metrics-only: {e.message}")
-        except Exception as e:
-            logger.warning(f"Unexpected error during LLM scoring, using metrics-only: {str(e)}")
-
-    result = scorer.score_overall_with_feedback(metrics, transcript, llm_metrics)
+        if use_llm and transcript:
+            try:
+                from .llm_processing import extract_llm_annotations, aggregate_llm_metrics
+                
+                llm_annotations = extract_llm_annotations(transcript)
+                llm_metrics = aggregate_llm_metrics(llm_annotations)
+                logger.info("LLM scoring successful")
+            except LLMProcessingError as e:
+                logger.warning(f"LLM scoring failed, falling back to metrics-only: {e.message}")
+            except Exception as e:
+                logger.warning(f"Unexpected error during LLM scoring, using metrics-only: {str(e)}")
+
+        result = scorer.score_overall_with_feedback(metrics, transcript, llm_metrics)
+        if cache_key is not None:
+            _score_cache_put(cache_key, result)
     
     # DEBUG: Log the actual criterion scores
     cb = result.get("criterion_bands", {})
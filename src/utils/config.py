@@ -15,6 +15,8 @@ This file defines:
 - Treat this file as product policy, not just engineering config.
 """
 
+from types import MappingProxyType
+
 VALID_CONTEXTS = {"conversational", "narrative", "presentation", "interview"}
 
 STOPWORDS = {
@@ -174,7 +176,7 @@ MIN_FILLER_DURATION = 0.02  # seconds
 
 # Set of consonants that can form stutters when rapidly repeated.
 # Example: "t-t-today", "b-b-but"
-STUTTER_CONSONANTS = set("BCDFGHJKLPQRSTVWXYZ")
+STUTTER_CONSONANTS = frozenset("BCDFGHJKLPQRSTVWXYZ")
 
 
 # ============================================================
@@ -343,6 +345,17 @@ CONTEXT_CONFIG = {
     },
 }
 
+# Flat per-context tolerance tables: one lookup instead of two per access
+CONTEXT_PAUSE_TOL = {
+    ctx: cfg["pause_tolerance"] for ctx, cfg in CONTEXT_CONFIG.items()
+}
+CONTEXT_PAUSE_VAR_TOL = {
+    ctx: cfg["pause_variability_tolerance"] for ctx, cfg in CONTEXT_CONFIG.items()
+}
+
+# Read-only view so the tables above can't drift from it at runtime
+CONTEXT_CONFIG = MappingProxyType(CONTEXT_CONFIG)
+
 
 # ============================================================
 # LOW-LEVEL DETECTION PARAMETERS
@@ -112,20 +112,15 @@ def get_tolerance_config(base_type: str) -> Dict[str, float]:
     Returns:
         Dictionary with pause_tolerance and pause_variability_tolerance
     """
-    from src.utils.config import CONTEXT_CONFIG
-    
-    if base_type in CONTEXT_CONFIG:
-        config = CONTEXT_CONFIG[base_type]
-        return {
-            "pause_tolerance": config.get("pause_tolerance", 1.0),
-            "pause_variability_tolerance": config.get("pause_variability_tolerance", 1.0),
-        }
+    from src.utils.config import CONTEXT_PAUSE_TOL, CONTEXT_PAUSE_VAR_TOL
     
     # Default to conversational
-    config = CONTEXT_CONFIG.get("conversational", {})
+    if base_type not in CONTEXT_PAUSE_TOL:
+        base_type = "conversational"
+    
     return {
-        "pause_tolerance": config.get("pause_tolerance", 1.0),
-        "pause_variability_tolerance": config.get("pause_variability_tolerance", 1.0),
+        "pause_tolerance": CONTEXT_PAUSE_TOL[base_type],
+        "pause_variability_tolerance": CONTEXT_PAUSE_VAR_TOL[base_type],
     }
 
 
@@ -0,0 +1,58 @@
+"""Test the fast analyzer's command-line entry point."""
+import asyncio
+import sys
+
+import pytest
+
+from src.core import analyzer_fast
+
+
+@pytest.fixture
+def audio_files(tmp_path):
+    """Two existing audio paths."""
+    paths = [tmp_path / "a.wav", tmp_path / "b.wav"]
+    for path in paths:
+        path.write_bytes(b"")
+    return [str(path) for path in paths]
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Record analyses instead of running them."""
+    recorded = []
+
+    async def fake_analyze(audio_path, speech_context="conversational", device="cpu"):
+        recorded.append((audio_path, speech_context))
+        return {}
+
+    monkeypatch.setattr(analyzer_fast, "analyze_speech_fast", fake_analyze)
+    return recorded
+
+
+def _run_main(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["analyzer_fast.py", *args])
+    return asyncio.run(analyzer_fast.main())
+
+
+def test_main_trailing_context_name(monkeypatch, calls, audio_files):
+    """Test a trailing known context name applies to every file."""
+    _run_main(monkeypatch, *audio_files, "ielts")
+
+    assert calls == [(audio_files[0], "ielts"), (audio_files[1], "ielts")]
+
+
+def test_main_defaults_to_conversational(monkeypatch, calls, audio_files):
+    """Test files without a context name use the conversational context."""
+    _run_main(monkeypatch, audio_files[0])
+
+    assert calls == [(audio_files[0], "conversational")]
+
+
+def test_main_reports_mistyped_path(monkeypatch, calls, audio_files, capsys):
+    """Test a missing trailing path is an error, not a speech context."""
+    with pytest.raises(SystemExit) as exc:
+        _run_main(monkeypatch, audio_files[0], audio_files[1][:-1])
+
+    assert exc.value.code == 1
+    assert f"Audio file not found: {audio_files[1][:-1]}" in capsys.readouterr().out
+    assert calls == []
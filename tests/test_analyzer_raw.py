@@ -0,0 +1,87 @@
+"""Test the word/filler merging helpers in the raw analyzer."""
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("librosa")
+pytest.importorskip("openai")
+
+from src.core.analyzer_raw import backfill_confidence, combine_words_and_fillers
+
+
+def test_backfill_confidence_matches_nearest_start():
+    """Each word takes the confidence of the nearest aligned start within tolerance."""
+    # Non-default, unsorted index: the write-back must be positional
+    df_words = pd.DataFrame(
+        {
+            "word": ["b", "a", "gap", "c", "nan"],
+            "start": [1.000, 0.500, 2.000, 3.000, np.nan],
+            "confidence": [0.1, 0.1, 0.1, 0.1, 0.1],
+        },
+        index=[40, 10, 30, 20, 50],
+    )
+    df_aligned = pd.DataFrame({
+        # 0.995 and 1.004 both fall in the window for 1.000; 1.004 is nearer
+        "start": [1.004, 0.995, 0.505, np.nan, 2.5, 3.0],
+        "confidence": [0.9, 0.2, 0.7, 0.99, 0.8, 0.6],
+    })
+
+    updated = backfill_confidence(df_words, df_aligned)
+
+    assert updated == 3
+    assert df_words.index.tolist() == [40, 10, 30, 20, 50]
+    assert df_words["confidence"].tolist() == [0.9, 0.7, 0.1, 0.6, 0.1]
+
+
+def test_backfill_confidence_without_aligned_confidence():
+    """Missing or empty alignment leaves the words untouched."""
+    df_words = pd.DataFrame({"start": [0.5], "confidence": [0.1]})
+
+    assert backfill_confidence(df_words, pd.DataFrame()) == 0
+    assert backfill_confidence(df_words, pd.DataFrame({"start": [0.5]})) == 0
+    assert df_words["confidence"].tolist() == [0.1]
+
+
+def test_combine_words_and_fillers_order_and_filtering():
+    """Tokens are sorted by start; on ties Whisper words precede Wav2Vec2 events."""
+    df_words = pd.DataFrame({
+        "word": [" I ", "think", "  ", "so", "lost"],
+        "start": [0.0, 1.0, 1.5, 2.0, np.nan],
+        "end": [0.4, 1.4, 1.6, 2.3, 3.0],
+    })
+    df_fillers = pd.DataFrame({
+        "start": [1.0, 0.5, 3.0, 2.0],
+        "end": [1.2, 0.9, 3.1, 2.1],
+        "text": ["um", "uh", None, " "],
+        "type": ["filler", "stutter", "filler", "filler"],
+    })
+
+    df = combine_words_and_fillers(df_words, df_fillers)
+
+    assert df.columns.tolist() == ["start", "end", "text", "source", "type"]
+    assert df["text"].tolist() == ["I", "uh", "think", "um", "so"]
+    assert df["source"].tolist() == ["whisper", "wav2vec", "whisper", "wav2vec", "whisper"]
+    assert df["type"].tolist() == ["word", "stutter", "word", "filler", "word"]
+    assert df["start"].tolist() == [0.0, 0.5, 1.0, 1.0, 2.0]
+
+
+def test_combine_words_and_fillers_missing_columns():
+    """Fillers without text are dropped; without a type column they default to 'filler'."""
+    df_words = pd.DataFrame({"word": ["hi"], "start": [0.0], "end": [0.2]})
+
+    no_text = pd.DataFrame({"start": [0.5], "end": [0.6], "type": ["stutter"]})
+    df = combine_words_and_fillers(df_words, no_text)
+    assert df["text"].tolist() == ["hi"]
+
+    no_type = pd.DataFrame({"start": [0.5], "end": [0.6], "text": ["er"]})
+    df = combine_words_and_fillers(df_words, no_type)
+    assert df["text"].tolist() == ["hi", "er"]
+    assert df["type"].tolist() == ["word", "filler"]
+
+
+def test_combine_words_and_fillers_empty():
+    """No usable tokens gives an empty frame with the expected columns."""
+    df = combine_words_and_fillers(pd.DataFrame(), pd.DataFrame())
+
+    assert df.empty
+    assert df.columns.tolist() == ["start", "end", "text", "source", "type"]
@@ -0,0 +1,189 @@
+"""Test filler and disfluency detection helpers."""
+from types import SimpleNamespace
+
+import pytest
+import numpy as np
+import pandas as pd
+from src.audio.filler_detection import (
+    _wav2vec_events_parallel,
+    detect_fillers_wav2vec,
+    looks_like_filler_mask,
+    mark_filler_words,
+    overlaps_any_word_relaxed,
+    is_word_initial_candidate,
+    group_stutters,
+)
+
+
+@pytest.fixture
+def words():
+    """Aligned words at 1-2s and 3-4s."""
+    return pd.DataFrame({"start": [1.0, 3.0], "end": [2.0, 4.0]})
+
+
+def test_overlaps_any_word_relaxed_scalar(words):
+    """Test scalar overlap check with tolerance."""
+    assert overlaps_any_word_relaxed(0.5, 0.99, words) is True
+    assert overlaps_any_word_relaxed(0.5, 0.97, words) is False
+    assert overlaps_any_word_relaxed(2.5, 2.9, words) is False
+
+
+def test_overlaps_any_word_relaxed_vectorized(words):
+    """Test array input returns one flag per event."""
+    starts = np.array([0.5, 2.5, 3.5])
+    ends = np.array([0.97, 2.9, 3.6])
+    
+    result = overlaps_any_word_relaxed(starts, ends, words)
+    
+    assert result.tolist() == [False, False, True]
+
+
+def test_overlaps_any_word_relaxed_no_words():
+    """Test that nothing overlaps an empty word list."""
+    empty = pd.DataFrame({"start": [], "end": []})
+    
+    result = overlaps_any_word_relaxed(np.array([0.5]), np.array([0.6]), empty)
+    
+    assert result.tolist() == [False]
+
+
+def test_is_word_initial_candidate(words):
+    """Test detection of events immediately preceding a word onset."""
+    ends = np.array([0.9, 0.5, 2.95, 4.5])
+    
+    result = is_word_initial_candidate(ends, words[["start"]], max_lead=0.12)
+    
+    assert result.tolist() == [True, False, True, False]
+    assert is_word_initial_candidate(0.9, words[["start"]], max_lead=0.12) is True
+    assert is_word_initial_candidate(0.9, words.iloc[:0][["start"]]) is False
+
+
+def test_group_stutters_merges_repetitions():
+    """Test that close repetitions of the same sound collapse into one event."""
+    df = pd.DataFrame({
+        "type": ["stutter", "stutter", "stutter", "filler"],
+        "raw_label": ["T", "T", "T", "A"],
+        "text": ["t", "t", "t", "uh"],
+        "start": [1.0, 1.1, 1.2, 3.0],
+        "end": [1.05, 1.15, 1.25, 3.3],
+        "duration": [0.05, 0.05, 0.05, 0.3],
+    })
+    
+    result = group_stutters(df)
+    
+    assert result["type"].tolist() == ["stutter", "filler"]
+    assert result.loc[0, "count"] == 3
+    assert result.loc[0, "end"] == pytest.approx(1.25)
+    assert result.loc[0, "duration"] == pytest.approx(0.25)
+
+
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]"])
+def test_looks_like_filler_mask_rejects_mixed_labels(dtype):
+    """Test only pure vowel or pure nasal labels are filler-shaped, on any string dtype."""
+    if dtype != object:
+        pytest.importorskip("pyarrow")
+    norm = pd.Series(["AM", "A", "MN", "M", "N", "T"], dtype=dtype)
+    duration = np.array([0.1, 0.1, 0.1, 0.1, 0.1, 0.1])
+    
+    result = looks_like_filler_mask(norm, duration)
+    
+    assert result.tolist() == [False, True, False, True, True, False]
+
+
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]"])
+def test_mark_filler_words_string_dtypes(dtype):
+    """Test direct fillers, fused variants and content words on any string dtype."""
+    if dtype != object:
+        pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"word": pd.Series(["Um,", "uhhh", "Errm.", "hello", "mn"], dtype=dtype)})
+    
+    result = mark_filler_words(df)
+    
+    assert result["is_filler"].tolist() == [True, True, True, False, True]
+
+
+def test_detect_fillers_wav2vec_classification():
+    """Test filler, stutter, suppressed and dropped phoneme events."""
+    aligned_words = pd.DataFrame({"start": [5.0, 8.0], "end": [5.5, 8.5]})
+    events = [
+        ("AA", 1.00, 1.30),   # vowel hesitation -> filler "uh"
+        ("mm", 2.00, 2.25),   # nasal hum, case-folded -> filler "um"
+        ("O", 3.00, 3.30),    # vowel outside FILLER_MAP -> filler "uh"
+        ("T", 3.60, 3.65),    # short consonant -> stutter "t"
+        ("T", 3.80, 4.00),    # consonant too long for a stutter -> dropped
+        ("K", 4.96, 4.98),    # ultra-short word-initial junk -> suppressed
+        ("S", 5.20, 5.25),    # inside a word -> dropped
+        ("B", 6.50, 6.52),    # short consonant -> stutter "b"
+        ("N", 7.86, 7.96),    # word-initial but filler-shaped -> filler "um"
+        ("E", 9.00, 9.01),    # below the minimum filler duration -> dropped
+    ]
+    df_wav2vec = pd.DataFrame(events, columns=["labels", "start", "end"])
+    df_wav2vec["label"] = df_wav2vec["labels"]
+    df_wav2vec["duration"] = df_wav2vec["end"] - df_wav2vec["start"]
+    
+    result = detect_fillers_wav2vec("unused.wav", aligned_words, df_wav2vec=df_wav2vec)
+    
+    assert result["type"].tolist() == ["filler", "filler", "filler", "stutter", "stutter", "filler"]
+    assert result["text"].tolist() == ["uh", "um", "uh", "t", "b", "um"]
+    assert result["raw_label"].tolist() == ["AA", "MM", "O", "T", "B", "N"]
+    assert result["start"].tolist() == pytest.approx([1.0, 2.0, 3.0, 3.6, 6.5, 7.86])
+    assert (result["word"] == result["text"]).all()
+    assert (result["style"] == "subtle").all()
+
+
+class _StubTokenizer:
+    """Token id 0 is the CTC pad; id i > 0 is the letter chr(64 + i)."""
+    
+    def convert_tokens_to_ids(self, token):
+        return 0
+    
+    def convert_ids_to_tokens(self, ids):
+        if isinstance(ids, int):
+            return "<pad>" if ids == 0 else chr(64 + ids)
+        return [self.convert_ids_to_tokens(i) for i in ids]
+
+
+def _stub_wav2vec(torch):
+    """Processor/model pair whose per-frame token id is the frame's first sample."""
+    frame = 320  # 20 ms at 16kHz
+    
+    class Model(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.anchor = torch.nn.Parameter(torch.zeros(1))
+        
+        def forward(self, input_values):
+            x = input_values[0]
+            n = x.shape[0] // frame
+            ids = x[: n * frame].view(n, frame)[:, 0].round().long()
+            return SimpleNamespace(logits=torch.nn.functional.one_hot(ids, 8).float()[None])
+    
+    def processor(waveform, sampling_rate, return_tensors):
+        return {"input_values": waveform[None]}
+    
+    processor.tokenizer = _StubTokenizer()
+    return processor, Model()
+
+
+def test_wav2vec_windows_emit_boundary_events_once():
+    """Test events straddling or starting on a window boundary come out exactly once."""
+    torch = pytest.importorskip("torch")
+    processor, model = _stub_wav2vec(torch)
+    
+    sr = 16000
+    waveform = torch.zeros(3 * sr)
+    waveform[int(0.9 * sr):int(1.1 * sr)] = 1   # straddles the 1s boundary
+    waveform[int(2.0 * sr):int(2.1 * sr)] = 2   # starts exactly on the 2s boundary
+    
+    events = _wav2vec_events_parallel(
+        processor, model, waveform, chunk_sec=1.0, overlap_sec=0.2
+    )
+    
+    assert [e["label"] for e in events] == ["A", "B"]
+    assert events[0]["start"] == pytest.approx(0.9)
+    assert events[0]["end"] == pytest.approx(1.1)
+    assert events[1]["start"] == pytest.approx(2.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
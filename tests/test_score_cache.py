@@ -0,0 +1,109 @@
+"""Test the metrics-only score cache in the IELTS band scorer."""
+import pytest
+
+pytest.importorskip("openai")
+
+from src.core import ielts_band_scorer as scorer_module
+from src.core.ielts_band_scorer import score_ielts_speaking
+
+
+METRICS = {
+    "wpm": 120,
+    "long_pauses_per_min": 1.0,
+    "pause_variability": 0.6,
+    "repetition_ratio": 0.05,
+    "mean_word_confidence": 0.88,
+    "low_confidence_ratio": 0.15,
+    "vocab_richness": 0.52,
+    "lexical_density": 0.46,
+    "mean_utterance_length": 25,
+    "speech_rate_variability": 0.3,
+}
+TRANSCRIPT = "well I think that travelling is really important for young people"
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    scorer_module._SCORE_CACHE.clear()
+    yield
+    scorer_module._SCORE_CACHE.clear()
+
+
+def _count_scoring(monkeypatch):
+    """Wrap the scorer so tests can count uncached scoring calls."""
+    calls = []
+    original = scorer_module.IELTSBandScorer.score_overall_with_feedback
+
+    def counting(self, *args, **kwargs):
+        calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(scorer_module.IELTSBandScorer, "score_overall_with_feedback", counting)
+    return calls
+
+
+def test_repeat_call_is_served_from_cache(monkeypatch):
+    """Same metrics and transcript score once and return independent copies."""
+    calls = _count_scoring(monkeypatch)
+
+    first = score_ielts_speaking(dict(METRICS), TRANSCRIPT, use_llm=False)
+    first["criterion_bands"]["fluency_coherence"] = -1
+    second = score_ielts_speaking(dict(METRICS), TRANSCRIPT, use_llm=False)
+
+    assert len(calls) == 1
+    assert second["criterion_bands"]["fluency_coherence"] != -1
+
+
+def test_cache_key_holds_digest_not_transcript():
+    """Cached entries never keep the raw transcript text."""
+    score_ielts_speaking(dict(METRICS), TRANSCRIPT, use_llm=False)
+
+    (key,) = scorer_module._SCORE_CACHE
+    assert TRANSCRIPT not in key
+    assert all(TRANSCRIPT not in str(part) for part in key)
+
+
+def test_expired_entry_is_rescored(monkeypatch):
+    """Entries past their TTL are dropped and recomputed."""
+    calls = _count_scoring(monkeypatch)
+    now = [1000.0]
+    monkeypatch.setattr(scorer_module.time, "monotonic", lambda: now[0])
+
+    score_ielts_speaking(dict(METRICS), TRANSCRIPT, use_llm=False)
+    now[0] += scorer_module._SCORE_CACHE_TTL_SEC - 1
+    score_ielts_speaking(dict(METRICS), TRANSCRIPT, use_llm=False)
+    assert len(calls) == 1
+
+    now[0] += 2
+    score_ielts_speaking(dict(METRICS), TRANSCRIPT, use_llm=False)
+    assert len(calls) == 2
+
+
+def test_cache_is_bounded(monkeypatch):
+    """The oldest entry is evicted once the cache is full."""
+    monkeypatch.setattr(scorer_module, "_SCORE_CACHE_MAX", 2)
+
+    for transcript in ("one", "two", "three"):
+        score_ielts_speaking(dict(METRICS), transcript, use_llm=False)
+
+    assert len(scorer_module._SCORE_CACHE) == 2
+    assert scorer_module._score_cache_key(METRICS, "one") not in scorer_module._SCORE_CACHE
+
+
+def test_unhashable_metrics_skip_cache(monkeypatch):
+    """Unhashable metric values are scored directly, and scorer errors still propagate."""
+    calls = _count_scoring(monkeypatch)
+    metrics = dict(METRICS, pause_positions=[1.0, 2.0])
+
+    score_ielts_speaking(metrics, TRANSCRIPT, use_llm=False)
+    score_ielts_speaking(metrics, TRANSCRIPT, use_llm=False)
+
+    assert len(calls) == 2
+    assert not scorer_module._SCORE_CACHE
+
+    def boom(self, *args, **kwargs):
+        raise TypeError("scorer bug")
+
+    monkeypatch.setattr(scorer_module.IELTSBandScorer, "score_overall_with_feedback", boom)
+    with pytest.raises(TypeError, match="scorer bug"):
+        score_ielts_speaking(dict(METRICS), TRANSCRIPT, use_llm=False)
@@ -0,0 +1,39 @@
+"""Test int8 quantization of the CPU Whisper model."""
+import pytest
+
+torch = pytest.importorskip("torch")
+whisper = pytest.importorskip("whisper")
+
+from torch.ao.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+from whisper.model import Linear as WhisperLinear, ModelDimensions, Whisper
+
+from src.audio import processing
+
+
+def _tiny_whisper():
+    """Randomly initialized Whisper small enough to build without a download."""
+    dims = ModelDimensions(
+        n_mels=80, n_audio_ctx=8, n_audio_state=16, n_audio_head=2, n_audio_layer=1,
+        n_vocab=64, n_text_ctx=8, n_text_state=16, n_text_head=2, n_text_layer=1,
+    )
+    return Whisper(dims)
+
+
+def test_cpu_model_has_quantized_linears(monkeypatch):
+    """Test the cached CPU loader returns a model with int8 Linear layers."""
+    monkeypatch.setattr(whisper, "load_model", lambda *args, **kwargs: _tiny_whisper())
+    processing._get_whisper_model.cache_clear()
+    
+    try:
+        model = processing._get_whisper_model("tiny", "cpu", None)
+    finally:
+        processing._get_whisper_model.cache_clear()
+    
+    modules = list(model.modules())
+    assert any(isinstance(m, DynamicQuantizedLinear) for m in modules)
+    assert not any(isinstance(m, WhisperLinear) for m in modules)
+    assert not any(type(m) is torch.nn.Linear for m in modules)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])